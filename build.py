@@ -11,49 +11,281 @@ Disclaimer: Provided AS IS. See LICENSE for details.
 
 import os
 import sys
-import subprocess
+import json
+import hashlib
 import shutil
-import requests
-import zipfile
-import tempfile
+import stat
+import threading
 from pathlib import Path
 import argparse
+from itertools import chain
+from concurrent.futures import ThreadPoolExecutor, wait
+
+
+def _try_import(package, import_name):
+    """Import a module, returning the pip package name if it is missing"""
+    try:
+        __import__(import_name)
+    except ImportError:
+        return package
+    return None
+
+
+def _write_if_changed(path, content):
+    """Write text to a file unless it already holds exactly that content"""
+    # Match text-mode writes, which use the platform's line endings
+    data = content.replace('\n', os.linesep).encode('utf-8')
+    try:
+        if path.read_bytes() == data:
+            return False
+    except OSError:
+        pass
+    path.write_bytes(data)
+    return True
+
+
+def _file_sha256(path):
+    """Return the hex SHA256 digest of a file's contents"""
+    with open(path, 'rb') as f:
+        if hasattr(hashlib, 'file_digest'):  # Python 3.11+
+            return hashlib.file_digest(f, 'sha256').hexdigest()
+        digest = hashlib.sha256()
+        for chunk in iter(lambda: f.read(1 << 20), b''):
+            digest.update(chunk)
+        return digest.hexdigest()
+
+
+def _copy_with_stat(src, dst):
+    """Copy a file's contents followed by its permission bits and timestamps"""
+    shutil.copyfile(src, dst)
+    shutil.copystat(src, dst)
+
+
+def _clear_readonly(func, path, _exc):
+    """rmtree error handler that retries after clearing the read-only bit"""
+    os.chmod(path, stat.S_IWRITE)
+    func(path)
+
+
+def _rmtree(path):
+    """shutil.rmtree that also removes read-only files (common on Windows)"""
+    if sys.version_info >= (3, 12):
+        shutil.rmtree(path, onexc=_clear_readonly)
+    else:
+        shutil.rmtree(path, onerror=_clear_readonly)
+
+
+def _unlink(path):
+    """Remove a single file, clearing the read-only bit if needed"""
+    try:
+        os.unlink(path)
+    except PermissionError:
+        _clear_readonly(os.unlink, path, None)
+
+
+def _fast_rmtree(root):
+    """Delete a directory tree, removing its top-level entries in parallel"""
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        futures = []
+        with os.scandir(root) as entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    futures.append(executor.submit(_rmtree, entry.path))
+                else:
+                    futures.append(executor.submit(_unlink, entry.path))
+        for future in futures:
+            future.result()
+    os.rmdir(root)
+
+
+def _hardlink_tree(src, dst):
+    """Mirror a directory tree with hard links, copying where linking fails"""
+    os.makedirs(dst, exist_ok=True)
+    with os.scandir(src) as entries:
+        for entry in entries:
+            target = os.path.join(dst, entry.name)
+            if entry.is_dir(follow_symlinks=False):
+                _hardlink_tree(entry.path, target)
+                continue
+            try:
+                os.link(entry.path, target)
+            except OSError:
+                # Different volume or filesystem without hard link support
+                shutil.copy2(entry.path, target)
+
+
+def _find_missing_package(package, import_name):
+    """Check installed metadata for a package, returning its name if missing"""
+    from importlib.metadata import distribution, PackageNotFoundError
+    
+    try:
+        distribution(package)
+    except PackageNotFoundError:
+        return package
+    except Exception:
+        # Unreadable or unusual metadata - fall back to actually importing it
+        return _try_import(package, import_name)
+    return None
+
 
 class MyLocalAPIBuilder:
     """Handles building and packaging MyLocalAPI"""
     
+    # Standard library packages nothing in the app or its dependencies
+    # imports. tkinter (GUI), email/html/http.server (werkzeug, urllib3,
+    # markupsafe) and pydoc (werkzeug.debug) are needed and must stay.
+    PYINSTALLER_EXCLUDES = (
+        'matplotlib', 'numpy', 'scipy', 'pandas', 'jupyter',
+        'notebook', 'IPython', 'test', 'tests', 'unittest', 'xml.etree',
+        'lib2to3', 'distutils', 'pydoc_data', 'xmlrpc', 'curses', 'sqlite3',
+        'multiprocessing.dummy'
+    )
+    
+    PYINSTALLER_HIDDEN_IMPORTS = (
+        'win32gui', 'win32con', 'win32process', 'win32com.shell',
+        'pystray._win32', 'PIL._tkinter_finder', 'psutil',
+        'src.server', 'src.gui', 'src.audio_control', 'src.settings',
+        'src.utils', 'src.streaming', 'src.fan_control', 'src.gaming_control',
+        'src.win_processes'
+    )
+    
     def __init__(self):
         self.project_root = Path(__file__).parent
         self.dist_dir = self.project_root / 'dist'
         self.build_dir = self.project_root / 'build'
         self.scripts_dir = self.project_root / 'scripts'
-        
-    def clean_build_dirs(self):
+        self.stamp_file = self.build_dir / '.stamp.json'
+        self.spec_file = self.build_dir / 'MyLocalAPI.spec'
+        self.spec_args_file = self.build_dir / '.spec_args.json'
+        self.hash_cache_file = self.build_dir / '.hashcache.json'
+        # Optional pinned SHA256 of the svcl-x64.zip download
+        self.svcl_sha256 = os.environ.get('MYLOCALAPI_SVCL_SHA256', '').strip().lower()
+        self._print_lock = threading.Lock()
+        # PyInstaller options that never change between builds
+        self._pyinstaller_static_args = tuple(chain(
+            chain.from_iterable(('--exclude-module', m) for m in self.PYINSTALLER_EXCLUDES),
+            chain.from_iterable(('--hidden-import', m) for m in self.PYINSTALLER_HIDDEN_IMPORTS),
+        ))
+        
+    def _log(self, message):
+        """Print a line without interleaving output from parallel build steps"""
+        with self._print_lock:
+            print(message, flush=True)
+        
+    def clean_build_dirs(self, include_cache=True):
         """Clean existing build directories"""
-        print("🧹 Cleaning build directories...")
+        self._log("🧹 Cleaning build directories...")
         
-        dirs_to_clean = [self.dist_dir, self.build_dir]
+        # build/ holds PyInstaller's Analysis cache and the generated spec
+        dirs_to_clean = [self.dist_dir, self.build_dir] if include_cache else [self.dist_dir]
         for dir_path in dirs_to_clean:
             if dir_path.exists():
-                shutil.rmtree(dir_path)
-                print(f"   Removed: {dir_path}")
+                _fast_rmtree(dir_path)
+                self._log(f"   Removed: {dir_path}")
         
-        print("✓ Build directories cleaned")
+        self._log("✓ Build directories cleaned")
     
+    # Files and directories whose contents end up in (or shape) the executable
+    # Project files copied into the distribution package: (source, name in package)
+    DOCS_TO_COPY = (
+        ('README.md', 'README.md'),
+        ('LICENSE', 'LICENSE.txt'),
+        ('settings.json', 'settings-sample.json'),
+    )
+
+    # Everything a build reads; the packaged docs are included so editing one
+    # isn't mistaken for an unchanged build
+    BUILD_INPUTS = ('src', 'scripts', 'assets', 'static', 'requirements.txt',
+                    'version_info.py', 'build.py') + tuple(src for src, _ in DOCS_TO_COPY)
+
+    SVCL_URL = "https://www.nirsoft.net/utils/svcl-x64.zip"
+
+    def _iter_input_files(self, path):
+        """Yield DirEntry objects for every file under an input directory"""
+        with os.scandir(path) as entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    if entry.name != '__pycache__':
+                        yield from self._iter_input_files(entry.path)
+                elif entry.is_file():
+                    yield entry
+
+    def _compute_build_hash(self, build_type):
+        """Fingerprint build inputs from their paths and contents"""
+        # File hashes are cached against (mtime, size) so only files that
+        # changed since the last run are read again
+        try:
+            with open(self.hash_cache_file, 'r', encoding='utf-8') as f:
+                cache = json.load(f)
+        except (OSError, ValueError):
+            cache = {}
+        new_cache = {}
+        
+        digest = hashlib.sha256(build_type.encode('utf-8'))
+        for name in self.BUILD_INPUTS:
+            path = self.project_root / name
+            if path.is_dir():
+                files = sorted(self._iter_input_files(path), key=lambda e: e.path)
+                stats = ((Path(e.path), e.stat()) for e in files)
+            elif path.is_file():
+                stats = [(path, path.stat())]
+            else:
+                continue
+            for file_path, st in stats:
+                rel = file_path.relative_to(self.project_root).as_posix()
+                cached = cache.get(rel)
+                if cached and cached[0] == st.st_mtime_ns and cached[1] == st.st_size:
+                    file_hash = cached[2]
+                else:
+                    file_hash = _file_sha256(file_path)
+                new_cache[rel] = [st.st_mtime_ns, st.st_size, file_hash]
+                digest.update(f"{rel}\0{file_hash}\n".encode('utf-8'))
+        
+        if new_cache != cache:
+            try:
+                self.build_dir.mkdir(exist_ok=True)
+                with open(self.hash_cache_file, 'w', encoding='utf-8') as f:
+                    json.dump(new_cache, f)
+            except OSError:
+                pass
+        return digest.hexdigest()
+
+    def _is_build_current(self, build_hash):
+        """Check whether the last successful build used identical inputs"""
+        if not (self.dist_dir / 'MyLocalAPI-Package').exists():
+            return False
+        try:
+            with open(self.stamp_file, 'r', encoding='utf-8') as f:
+                return json.load(f).get('hash') == build_hash
+        except (OSError, ValueError):
+            return False
+
+    def _write_build_stamp(self, build_hash):
+        """Record the inputs of a successful build"""
+        self.build_dir.mkdir(exist_ok=True)
+        with open(self.stamp_file, 'w', encoding='utf-8') as f:
+            json.dump({'hash': build_hash}, f)
+
     def check_dependencies(self):
         """Check if all required dependencies are installed"""
         print("📦 Checking dependencies...")
         
         # Check if we're in a virtual environment (recommended)
-        import sys
-        in_venv = hasattr(sys, 'real_prefix') or (hasattr(sys, 'base_prefix') and sys.base_prefix != sys.prefix)
+        in_venv = sys.prefix != sys.base_prefix
         
         if not in_venv:
             print("⚠️  WARNING: Not running in a virtual environment")
             print("   Recommended: Create venv to avoid conflicts")
             print("   Run: python -m venv venv && venv\\Scripts\\activate")
-            response = input("Continue anyway? (y/N): ")
-            if response.lower() != 'y':
+            if os.environ.get('MYLOCALAPI_ALLOW_NO_VENV') == '1':
+                print("   Continuing (MYLOCALAPI_ALLOW_NO_VENV=1)")
+            elif sys.stdin is not None and sys.stdin.isatty():
+                response = input("Continue anyway? (y/N): ")
+                if response.lower() != 'y':
+                    return False
+            else:
+                # Nobody to answer the prompt (CI); fail instead of hanging
+                print("   Set MYLOCALAPI_ALLOW_NO_VENV=1 to build outside a virtual environment")
                 return False
         else:
             print("✓ Running in virtual environment")
@@ -69,12 +301,12 @@ class MyLocalAPIBuilder:
             'pyinstaller': 'PyInstaller'
         }
 
-        missing_packages = []
-        for package, import_name in package_import_map.items():
-            try:
-                __import__(import_name)
-            except ImportError:
-                missing_packages.append(package)
+        # Installed metadata is enough to confirm presence; this avoids
+        # executing each package's (often heavy) import-time code
+        missing_packages = [
+            package for package, import_name in package_import_map.items()
+            if _find_missing_package(package, import_name)
+        ]
         
         if missing_packages:
             print(f"❌ Missing packages: {', '.join(missing_packages)}")
@@ -90,41 +322,67 @@ class MyLocalAPIBuilder:
         svcl_exe = svcl_dir / 'svcl.exe'
         
         if svcl_exe.exists():
-            print("✓ svcl.exe already present")
+            self._log("✓ svcl.exe already present")
             return True
         
-        print("📥 Downloading svcl.exe (SoundVolumeCommandLine)...")
+        self._log("📥 Downloading svcl.exe (SoundVolumeCommandLine)...")
         
         # Create directories
         svcl_dir.mkdir(parents=True, exist_ok=True)
         
-        # Download URL for svcl.exe (this would need to be the actual URL)
-        # Note: In a real implementation, you'd need the actual download URL
-        svcl_url = "https://www.nirsoft.net/utils/svcl-x64.zip"
+        # Only needed here, so keep them off the start-up path
+        import urllib.error
+        import urllib.request
+        import zipfile
+        
+        # Partial downloads are kept and resumed on the next attempt
+        part_file = svcl_dir / 'svcl-x64.zip.part'
         
         try:
-            # This is a placeholder - actual implementation would need real download logic
-            print("⚠️  Manual step required:")
-            print(f"   Please download svcl.exe from NirSoft and place it in: {svcl_dir}")
-            print("   URL: https://www.nirsoft.net/utils/sound_volume_command_line.html")
-            print("   Extract svcl.exe to the scripts/svcl-x64/ directory")
+            offset = part_file.stat().st_size if part_file.exists() else 0
+            headers = {'User-Agent': 'MyLocalAPI-build'}
+            if offset:
+                headers['Range'] = f'bytes={offset}-'
             
-            # Check if user completed manual step
-            if not svcl_exe.exists():
-                response = input("Have you downloaded and placed svcl.exe? (y/N): ")
-                if response.lower() != 'y':
-                    print("❌ svcl.exe is required for audio control functionality")
-                    return False
+            try:
+                request = urllib.request.Request(self.SVCL_URL, headers=headers)
+                with urllib.request.urlopen(request, timeout=60) as response:
+                    # Servers that ignore Range send the whole file again
+                    mode = 'ab' if offset and response.status == 206 else 'wb'
+                    with open(part_file, mode) as f:
+                        shutil.copyfileobj(response, f, length=1 << 20)
+            except urllib.error.HTTPError as e:
+                # 416 means the partial file is already complete
+                if e.code != 416 or not offset:
+                    raise
             
-            if svcl_exe.exists():
-                print("✓ svcl.exe found and ready for bundling")
-                return True
-            else:
-                print("❌ svcl.exe still not found")
+            actual_sha256 = _file_sha256(part_file)
+            self._log(f"   SHA256: {actual_sha256}")
+            
+            if self.svcl_sha256 and actual_sha256 != self.svcl_sha256:
+                part_file.unlink()
+                self._log(f"❌ svcl-x64.zip checksum mismatch (expected {self.svcl_sha256})")
                 return False
+            
+            with zipfile.ZipFile(part_file) as zf:
+                member = next((name for name in zf.namelist()
+                               if name.lower().rsplit('/', 1)[-1] == 'svcl.exe'), None)
+                if member is None:
+                    self._log("❌ svcl.exe not found in downloaded archive")
+                    return False
+                with zf.open(member) as src, open(svcl_exe, 'wb') as dst:
+                    shutil.copyfileobj(src, dst, length=1 << 20)
+            
+            part_file.unlink()
+            self._log("✓ svcl.exe downloaded and ready for bundling")
+            return True
                 
-        except Exception as e:
-            print(f"❌ Error setting up svcl.exe: {e}")
+        except (OSError, zipfile.BadZipFile) as e:
+            if isinstance(e, zipfile.BadZipFile) and part_file.exists():
+                part_file.unlink()
+            self._log(f"❌ Error downloading svcl.exe: {e}")
+            self._log(f"   Please download svcl.exe from NirSoft and place it in: {svcl_dir}")
+            self._log("   URL: https://www.nirsoft.net/utils/sound_volume_command_line.html")
             return False
     
     def create_version_info(self):
@@ -163,32 +421,43 @@ VSVersionInfo(
 '''
 
         version_file = self.project_root / 'version_info.py'
-        with open(version_file, 'w', encoding='utf-8') as f:
-                f.write(version_content)
-
-        print("✓ Version info file created")
+        if _write_if_changed(version_file, version_content):
+            self._log("✓ Version info file created")
+        else:
+            self._log("✓ Version info file up to date")
         return version_file
     
     def create_icon(self):
         """Create application icon"""
-        print("🎨 Checking application icon...")
+        self._log("🎨 Checking application icon...")
         
         existing_icon = self.project_root / 'MyLocalAPI_app_icon_new.ico'
         if existing_icon.exists():
-            print("✓ Using existing application icon")
+            self._log("✓ Using existing application icon")
             return existing_icon
         
         # Could not find or create an icon - return None
-        print("⚠️  Could not find or create an application icon")
+        self._log("⚠️  Could not find or create an application icon")
         return None
     
+    def precompile_sources(self):
+        """Byte-compile application sources ahead of PyInstaller's Analysis"""
+        import compileall
+        
+        # Analysis loads modules through their loaders, which reuse fresh
+        # __pycache__ entries, so compile everything up front on all cores
+        print("⚙️  Precompiling sources...")
+        if compileall.compile_dir(str(self.project_root / 'src'), quiet=1, workers=0):
+            print("✓ Sources precompiled")
+        else:
+            print("⚠️  Some sources failed to compile; PyInstaller will report details")
+    
     def build_executable(self, build_type='onefile'):
         """Build executable using PyInstaller"""
         print(f"🔨 Building executable ({build_type})...")
         
         args = [
             'pyinstaller',
-            '--clean',
             '--noconfirm',
         ]
         
@@ -234,39 +503,94 @@ VSVersionInfo(
         if version_file.exists():
             args.extend(['--version-file', str(version_file)])
         
-        excludes = [
-            'matplotlib', 'numpy', 'scipy', 'pandas', 'jupyter',
-            'notebook', 'IPython', 'test', 'tests', 'unittest', 'xml.etree'
-        ]
-        
-        for exclude in excludes:
-            args.extend(['--exclude-module', exclude])
-        
-        hidden_imports = [
-            'win32gui', 'win32con', 'win32process', 'win32com.shell',
-            'pystray._win32', 'PIL._tkinter_finder', 'psutil',
-            'src.server', 'src.gui', 'src.audio_control', 'src.settings',
-            'src.utils', 'src.streaming', 'src.fan_control', 'src.gaming_control'
-        ]
-        
-        for hidden in hidden_imports:
-            args.extend(['--hidden-import', hidden])
+        args.extend(self._pyinstaller_static_args)
         
         # Add src to Python path
         args.extend(['--paths', str(self.project_root / 'src')])
         
-        args.append('src/main.py')
+        # Keep the generated spec with the Analysis cache in build/ rather
+        # than overwriting the hand-maintained mylocalapi.spec in the root
+        args.extend(['--specpath', str(self.build_dir)])
         
+        args.append(str(self.project_root / 'src' / 'main.py'))
+        
+        # Reuse the spec generated by the last build when the options are
+        # unchanged; PyInstaller then skips Analysis for unchanged modules
+        spec_args = args
+        if self._spec_matches(args):
+            spec_args = ['pyinstaller', str(self.spec_file), '--noconfirm']
+        
+        print(f"Running: {' '.join(spec_args)}")
         try:
-            print(f"Running: {' '.join(args)}")
-            result = subprocess.run(args, check=True, capture_output=True, text=True)
-            print("✓ Executable built successfully")
+            import PyInstaller.__main__
+        except ImportError:
+            # Not importable from this interpreter; use the pyinstaller on PATH
+            if not self._run_pyinstaller_subprocess(spec_args):
+                return False
+            self._record_spec_args(args)
             return True
-        except subprocess.CalledProcessError as e:
-            print(f"❌ PyInstaller failed:")
-            print(f"   stdout: {e.stdout}")
-            print(f"   stderr: {e.stderr}")
+        
+        # Run in-process to reuse this interpreter instead of starting another
+        try:
+            PyInstaller.__main__.run(spec_args[1:])
+        except SystemExit as e:
+            if e.code not in (0, None):
+                print(f"❌ PyInstaller failed (exit code {e.code})")
+                return False
+        except Exception as e:
+            print(f"❌ PyInstaller failed: {e}")
             return False
+        
+        self._record_spec_args(args)
+        print("✓ Executable built successfully")
+        return True
+    
+    def _spec_matches(self, args):
+        """Check whether the generated spec was produced from these options"""
+        if not self.spec_file.exists():
+            return False
+        try:
+            with open(self.spec_args_file, 'r', encoding='utf-8') as f:
+                return json.load(f).get('args') == args
+        except (OSError, ValueError):
+            return False
+    
+    def _record_spec_args(self, args):
+        """Remember which options produced the generated spec"""
+        with open(self.spec_args_file, 'w', encoding='utf-8') as f:
+            json.dump({'args': args}, f)
+    
+    def _run_pyinstaller_subprocess(self, args):
+        """Run PyInstaller as an external command, streaming its output"""
+        import subprocess
+        from collections import deque
+        
+        # Echo output as it arrives and keep the full log on disk, holding
+        # only the last lines in memory for the failure report
+        tail = deque(maxlen=200)
+        log_file = self.build_dir / 'pyinstaller.log'
+        self.build_dir.mkdir(exist_ok=True)
+        try:
+            with open(log_file, 'w', encoding='utf-8') as log:
+                process = subprocess.Popen(args, stdout=subprocess.PIPE, stderr=subprocess.STDOUT,
+                                           text=True, bufsize=1)
+                for line in process.stdout:
+                    sys.stdout.write(line)
+                    log.write(line)
+                    tail.append(line)
+                returncode = process.wait()
+        except OSError as e:
+            print(f"❌ Could not run PyInstaller: {e}")
+            return False
+        
+        if returncode != 0:
+            print(f"❌ PyInstaller failed (exit code {returncode}); last output:")
+            print(''.join(tail))
+            print(f"   Full log: {log_file}")
+            return False
+        
+        print("✓ Executable built successfully")
+        return True
     
     def create_distribution_package(self):
         """Create distribution package with documentation"""
@@ -274,35 +598,41 @@ VSVersionInfo(
         
         # Find the built executable
         exe_path = None
-        if (self.dist_dir / 'MyLocalAPI.exe').exists():
-            exe_path = self.dist_dir / 'MyLocalAPI.exe'
-        elif (self.dist_dir / 'main.exe').exists():
-            exe_path = self.dist_dir / 'main.exe'
-        elif (self.dist_dir / 'MyLocalAPI').exists(): 
-            exe_path = self.dist_dir / 'MyLocalAPI'
+        try:
+            with os.scandir(self.dist_dir) as entries:
+                names = {entry.name for entry in entries}
+        except OSError:
+            names = set()
+        for candidate in ('MyLocalAPI.exe', 'main.exe', 'MyLocalAPI'):
+            if candidate in names:
+                exe_path = self.dist_dir / candidate
+                break
         
         if not exe_path:
             print("❌ Could not find built executable")
             return False
         
-        package_dir = self.dist_dir / 'MyLocalAPI-Package'
-        package_dir.mkdir(exist_ok=True)
-        
-        if exe_path.is_file():
-            shutil.copy2(exe_path, package_dir / 'MyLocalAPI.exe')
-        else:
-            shutil.copytree(exe_path, package_dir / 'MyLocalAPI', dirs_exist_ok=True)
-        
-        docs_to_copy = [
-            ('README.md', 'README.md'),
-            ('LICENSE', 'LICENSE.txt'),
-            ('settings.json', 'settings-sample.json'),
-        ]
-        
-        for src, dst in docs_to_copy:
-            src_path = self.project_root / src
-            if src_path.exists():
-                shutil.copy2(src_path, package_dir / dst)
+        # Assemble in a staging directory and swap it in once complete, so a
+        # failed run never leaves a half-populated package behind
+        final_dir = self.dist_dir / 'MyLocalAPI-Package'
+        package_dir = self.dist_dir / '.MyLocalAPI-Package.tmp'
+        if package_dir.exists():
+            _rmtree(package_dir)
+        package_dir.mkdir()
+        
+        copies = [(self.project_root / src, package_dir / dst)
+                  for src, dst in self.DOCS_TO_COPY if (self.project_root / src).exists()]
+        
+        # The executable and docs are independent, so copy them concurrently.
+        # Docs only need their contents; the exe keeps its timestamps.
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            if exe_path.is_file():
+                exe_copy = executor.submit(_copy_with_stat, exe_path, package_dir / 'MyLocalAPI.exe')
+            else:
+                exe_copy = executor.submit(_hardlink_tree, exe_path, package_dir / 'MyLocalAPI')
+            doc_copies = [executor.submit(shutil.copyfile, src, dst) for src, dst in copies]
+            for future in [exe_copy] + doc_copies:
+                future.result()
         
         # Create quick start guide
         quickstart_content = """MyLocalAPI - Quick Start Guide
@@ -325,10 +655,15 @@ API Examples:
 Change the token in settings for security!
 """
         
+        # The staging directory is always fresh, so there is nothing to compare against
         with open(package_dir / 'QUICKSTART.txt', 'w') as f:
             f.write(quickstart_content)
         
-        print(f"✓ Distribution package created: {package_dir}")
+        if final_dir.exists():
+            _rmtree(final_dir)
+        os.replace(package_dir, final_dir)
+        
+        print(f"✓ Distribution package created: {final_dir}")
         return True
     
     def run_tests(self):
@@ -340,23 +675,43 @@ Change the token in settings for security!
             print("⚠️  No unit tests found, skipping...")
             return True
         
+        import importlib.util
+        import unittest
+        
+        # Run in-process to avoid a second interpreter start-up; the tests
+        # import the application modules from src/
+        src_dir = str(self.project_root / 'src')
+        if src_dir not in sys.path:
+            sys.path.insert(0, src_dir)
+        
         try:
-            result = subprocess.run([sys.executable, str(test_file)], 
-                                  capture_output=True, text=True, check=True)
-            print("✓ All tests passed")
-            return True
-        except subprocess.CalledProcessError as e:
-            print("❌ Tests failed:")
-            print(e.stdout)
-            print(e.stderr)
+            spec = importlib.util.spec_from_file_location('test_unit', test_file)
+            module = importlib.util.module_from_spec(spec)
+            spec.loader.exec_module(module)
+        except Exception as e:
+            print(f"❌ Could not load tests: {e}")
             return False
+        
+        suite = unittest.defaultTestLoader.loadTestsFromModule(module)
+        result = unittest.TextTestRunner(verbosity=1).run(suite)
+        if not result.wasSuccessful():
+            print("❌ Tests failed")
+            return False
+        
+        print("✓ All tests passed")
+        return True
     
-    def build_all(self, build_type='onefile', skip_tests=False):
+    def build_all(self, build_type='onefile', skip_tests=False, force=False):
         """Run complete build process"""
         print("🚀 Starting MyLocalAPI build process...")
         print("=" * 50)
         
-        self.clean_build_dirs()
+        # Checked before cleaning, which would otherwise discard the outputs
+        if not force and self._is_build_current(self._compute_build_hash(build_type)):
+            print("✓ Build inputs unchanged since last build - nothing to do")
+            print(f"📁 Output directory: {self.dist_dir}")
+            return True
+        
         if not self.check_dependencies():
             return False
         
@@ -364,11 +719,26 @@ Change the token in settings for security!
             print("❌ Build failed: Tests did not pass")
             return False
         
-        if not self.download_svcl_exe():
+        # The preparation steps touch unrelated files, so run them together
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            svcl_future = executor.submit(self.download_svcl_exe)
+            prep_futures = [
+                executor.submit(self.clean_build_dirs, include_cache=force),
+                svcl_future,
+                executor.submit(self.create_version_info),
+                executor.submit(self.create_icon),
+            ]
+            wait(prep_futures)
+        
+        for future in prep_futures:
+            if future.exception() is not None:
+                print(f"❌ Build preparation failed: {future.exception()}")
+                return False
+        
+        if not svcl_future.result():
             print("⚠️  Continuing without svcl.exe - audio features may not work")
         
-        self.create_version_info()
-        self.create_icon()
+        self.precompile_sources()
         
         if not self.build_executable(build_type):
             return False
@@ -376,6 +746,10 @@ Change the token in settings for security!
         if not self.create_distribution_package():
             return False
         
+        # Fingerprint after the build so generated inputs (version_info.py)
+        # are recorded in their final state
+        self._write_build_stamp(self._compute_build_hash(build_type))
+        
         print("\n🎉 Build completed successfully!")
         print(f"📁 Output directory: {self.dist_dir}")
         print("\nNext steps:")
@@ -394,6 +768,8 @@ def main():
                         help='Skip running unit tests before build')
     parser.add_argument('--clean-only', action='store_true',
                         help='Only clean build directories and exit')
+    parser.add_argument('--force', action='store_true',
+                        help='Rebuild from scratch, ignoring the last build and its cache')
     
     args = parser.parse_args()
     
@@ -403,7 +779,8 @@ def main():
         builder.clean_build_dirs()
         return 0
     
-    success = builder.build_all(build_type=args.type, skip_tests=args.skip_tests)
+    success = builder.build_all(build_type=args.type, skip_tests=args.skip_tests,
+                                force=args.force)
     return 0 if success else 1
 
 if __name__ == '__main__':
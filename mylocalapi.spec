@@ -35,7 +35,8 @@ if scripts_dir.exists():
     datas.append((str(scripts_dir), 'scripts'))
 
 # Add icon files
-icon_files = ['assets/images/MyLocalAPI_app_icon_new.ico', 'assets/images/mylocalapiappicon.png', 'assets/images/systemtrayicon.png']
+icon_files = ['assets/images/MyLocalAPI_app_icon_new.ico', 'assets/images/mylocalapiappicon.png', 'assets/images/systemtrayicon.png',
+              'assets/images/mylocalapiappicon_32.png', 'assets/images/systemtrayicon_64.png']
 for icon_file in icon_files:
     icon_path = spec_dir / icon_file
     if icon_path.exists():
@@ -98,7 +99,8 @@ hiddenimports = [
     'src.settings',
     'src.server',
     'src.gui',
-    'src.utils'
+    'src.utils',
+    'src.win_processes'
 ]
 
 # Collect all Python files
@@ -10,24 +10,166 @@ Disclaimer: Provided AS IS. See README.md 'AS IS Disclaimer' for details.
 """
 
 import os
+import re
+import sys
 import logging
 import json
-import csv
+import codecs
 import io
+import queue
 import subprocess
-from typing import Dict, List, Optional, Tuple, Any
+import threading
+import time
+from collections import namedtuple
+from typing import Dict, Iterator, List, NamedTuple, Optional, Tuple, Any
 from src.utils import find_bundled_executable, run_subprocess_safe, clean_audio_device_id
 
 logger = logging.getLogger(__name__)
 
+# Volume strings from svcl.exe look like "57", "57.0" or "57.0%"
+_VOLUME_FLOAT_RE = re.compile(r'^\s*(\d+(?:\.\d+)?)\s*%?\s*$')
+_VOLUME_STRIP_RE = re.compile(r'[^\d.]')
+
+# Lookup tables derived from the configured device mappings:
+#   by_label      case-folded label -> device_id
+#   by_device_id  case-folded device_id -> label
+#   streaming_id  device_id of the first mapping flagged use_for_streaming
+_MappingIndex = namedtuple('_MappingIndex', ['by_label', 'by_device_id', 'streaming_id'])
+
+
+class PlaybackDevice(NamedTuple):
+    """A render endpoint parsed from the svcl.exe device dump"""
+    name: str
+    device_name: str
+    direction: str
+    default: str
+    default_multimedia: str
+    default_communications: str
+    volume_percent: Optional[int]
+    device_id: str
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Return the device as the JSON-friendly dict used by the API"""
+        return self._asdict()
+
+
+class _CoreAudioThread:
+    """Runs pycaw (Core Audio) calls on one long-lived COM thread
+    
+    Request and debounce threads are short-lived, so initializing COM on each
+    of them would never be balanced. Here COM is initialized once, and the
+    device enumerator and endpoint volume interface live and are released on
+    the thread that created them. The endpoint is re-activated only when the
+    default render device changes.
+    """
+    
+    def __init__(self, timeout: float = 2.0):
+        self._timeout = timeout
+        self._requests = queue.SimpleQueue()
+        self._thread: Optional[threading.Thread] = None
+        self._start_lock = threading.Lock()
+    
+    def call(self, fn):
+        """Return fn(endpoint) evaluated on the COM thread; raises on failure"""
+        with self._start_lock:
+            if self._thread is None or not self._thread.is_alive():
+                self._thread = threading.Thread(target=self._run, name="CoreAudio", daemon=True)
+                self._thread.start()
+        
+        done = threading.Event()
+        outcome = {}
+        self._requests.put((fn, done, outcome))
+        if not done.wait(self._timeout):
+            raise TimeoutError("Core Audio call timed out")
+        if "error" in outcome:
+            raise outcome["error"]
+        return outcome["result"]
+    
+    def _run(self) -> None:
+        from ctypes import cast, POINTER
+        import comtypes
+        from pycaw.pycaw import (CLSID_MMDeviceEnumerator, EDataFlow, ERole,
+                                 IAudioEndpointVolume, IMMDeviceEnumerator)
+        
+        comtypes.CoInitialize()
+        enumerator = endpoint = None
+        endpoint_id = None
+        try:
+            while True:
+                fn, done, outcome = self._requests.get()
+                device = None
+                try:
+                    if enumerator is None:
+                        enumerator = comtypes.CoCreateInstance(
+                            CLSID_MMDeviceEnumerator, IMMDeviceEnumerator, comtypes.CLSCTX_INPROC_SERVER)
+                    device = enumerator.GetDefaultAudioEndpoint(EDataFlow.eRender.value,
+                                                                ERole.eMultimedia.value)
+                    device_id = device.GetId()
+                    if endpoint is None or device_id != endpoint_id:
+                        endpoint = None
+                        interface = device.Activate(IAudioEndpointVolume._iid_, comtypes.CLSCTX_ALL, None)
+                        endpoint = cast(interface, POINTER(IAudioEndpointVolume))
+                        endpoint_id = device_id
+                    outcome["result"] = fn(endpoint)
+                except Exception as e:
+                    # Start from a fresh endpoint next time
+                    endpoint = None
+                    outcome["error"] = e
+                finally:
+                    device = None
+                    done.set()
+        finally:
+            # Release the interfaces before COM goes away on this thread
+            endpoint = enumerator = None
+            comtypes.CoUninitialize()
+
+
 class AudioController:
     """Controls Windows audio devices via svcl.exe"""
     
+    # Columns read from the svcl.exe /scomma dump
+    REQUIRED_COLUMNS = ('Name', 'Device Name', 'Direction', 'Default',
+                        'Default Multimedia', 'Default Communications',
+                        'Volume Percent', 'Command-Line Friendly ID')
+    
     def __init__(self, svv_path: Optional[str] = None):
         """Initialize with optional custom svcl.exe path"""
         self.svv_path = self._find_svcl_executable(svv_path)
         if not self.svv_path:
             raise RuntimeError("svcl.exe not found. Please ensure it's bundled with the application.")
+
+        # Short-lived cache of the /scomma device dump so back-to-back
+        # snapshot/switch calls share a single svcl.exe run
+        self._devices_cache: Optional[Dict[str, Any]] = None
+        self._devices_cache_ts = 0.0
+        self._devices_cache_ttl = 0.5
+        
+        # Column positions resolved from the last svcl.exe header line
+        self._header_signature: Optional[bytes] = None
+        self._column_indices: Dict[str, int] = {}
+        
+        # (device dump, _MappingIndex, snapshot) from the last get_audio_snapshot
+        self._last_snapshot: Optional[Tuple[Dict[str, Any], _MappingIndex, Dict[str, Any]]] = None
+        
+        # (mappings signature, _MappingIndex) for the last mappings seen
+        self._mapping_index: Optional[Tuple[Tuple, _MappingIndex]] = None
+        
+        # Optional in-process Core Audio backend (pycaw); cleared on first
+        # ImportError so we only try the import once
+        self._pycaw_available = sys.platform == 'win32'
+        self._core_audio: Optional[_CoreAudioThread] = None
+        
+        # Debounce state for set_volume_debounced: device -> (sequence, percent)
+        # for the latest value queued while the timer is pending
+        self._volume_lock = threading.Lock()
+        self._volume_timer: Optional[threading.Timer] = None
+        self._pending_volume: Dict[Optional[str], Tuple[int, int]] = {}
+        self._volume_seq = 0
+        # Serializes volume changes; a slow svcl.exe call must finish before
+        # the next value is applied. Re-entrant so set_volume can take it too.
+        self._volume_apply_lock = threading.RLock()
+        # device -> sequence of the newest debounced value applied
+        self._applied_volume_seq: Dict[Optional[str], int] = {}
         
         logger.info(f"Using audio tool: {self.svv_path}")
     
@@ -49,100 +191,140 @@ class AudioController:
         
         return None
     
-    def _run_svcl(self, args: List[str], timeout: int = 10) -> subprocess.CompletedProcess:
-        """Run svcl.exe with given arguments"""
+    def _run_svcl(self, args: List[str], timeout: int = 10, text: bool = True,
+                  want_stderr: bool = True) -> subprocess.CompletedProcess:
+        """Run svcl.exe with given arguments
+        
+        Read-only queries that only report the exit code on failure pass
+        want_stderr=False so stderr is discarded instead of captured.
+        """
         cmd = [self.svv_path] + args
-        return run_subprocess_safe(cmd, timeout=timeout, capture_output=True)
+        return run_subprocess_safe(cmd, timeout=timeout, capture_output=True, text=text,
+                                   capture_stderr=want_stderr)
+    
+    def invalidate_cache(self) -> None:
+        """Drop the cached device dump so the next read re-queries svcl.exe"""
+        self._devices_cache = None
+        self._devices_cache_ts = 0.0
+        self._last_snapshot = None
+
+    def _get_column_indices(self, header_line: bytes) -> Dict[str, int]:
+        """Map required column names to positions, reusing the last result
+        while svcl.exe keeps emitting the same header line"""
+        if header_line == self._header_signature:
+            return self._column_indices
+        
+        header_text = header_line.decode('utf-8', 'replace')
+        if '"' in header_text:
+            import csv
+            all_headers = next(csv.reader([header_text]))
+        else:
+            all_headers = [h.strip() for h in header_text.split(',')]
+        
+        header_pos: Dict[str, int] = {}
+        for i, header in enumerate(all_headers):
+            header_pos.setdefault(header, i)
+        
+        column_indices = {}
+        for col in self.REQUIRED_COLUMNS:
+            if col in header_pos:
+                column_indices[col] = header_pos[col]
+            else:
+                logger.warning(f"Column '{col}' not found in svcl.exe output")
+        
+        self._header_signature = header_line
+        self._column_indices = column_indices
+        return column_indices
     
     def get_devices_raw(self) -> Dict[str, Any]:
         """Get raw device information from svcl.exe"""
+        if (self._devices_cache is not None and
+                time.monotonic() - self._devices_cache_ts < self._devices_cache_ttl):
+            return self._devices_cache
+
         try:
-            # Use /Stdout with /scomma to get all CSV data to stdout
-            result = self._run_svcl(['/Stdout', '/scomma'])
+            # Use /Stdout with /scomma to get all CSV data to stdout. Read raw
+            # bytes: svcl.exe writes UTF-8, and only the handful of columns we
+            # keep need decoding
+            result = self._run_svcl(['/Stdout', '/scomma'], text=False)
             
             if result.returncode != 0:
-                logger.error(f"svcl.exe returned error code {result.returncode}: {result.stderr}")
-                return {"ok": False, "rows": [], "error": result.stderr}
+                stderr = (result.stderr or b'').decode('utf-8', 'replace')
+                logger.error(f"svcl.exe returned error code {result.returncode}: {stderr}")
+                return {"ok": False, "rows": [], "error": stderr}
             
             # Parse CSV output from stdout
             if not result.stdout.strip():
                 return {"ok": False, "rows": [], "error": "No output from svcl.exe"}
             
-            # Remove BOM if present and parse CSV
-            csv_content = result.stdout
-            if csv_content.startswith('\ufeff'):
-                csv_content = csv_content[1:]  # Remove BOM
+            # svcl.exe only ever emits a BOM at offset 0
+            csv_bytes = result.stdout
+            if csv_bytes.startswith(codecs.BOM_UTF8):
+                csv_bytes = csv_bytes[len(codecs.BOM_UTF8):]
             
-            # Also handle the visible BOM characters that might appear
-            csv_content = csv_content.replace('ï»¿', '')
-            
-            csv_lines = csv_content.strip().split('\n')
+            csv_lines = csv_bytes.splitlines()
             if len(csv_lines) < 2:
                 return {"ok": False, "rows": [], "error": "Insufficient CSV data"}
             
-            # Parse header to get column indices
-            header_line = csv_lines[0]
             data_lines = csv_lines[1:]
+            column_indices = self._get_column_indices(csv_lines[0])
             
-            csv_reader = csv.reader([header_line])
-            all_headers = next(csv_reader)
-            
-            # Clean up header names (remove any remaining BOM characters)
-            all_headers = [h.replace('\ufeff', '').replace('ï»¿', '') for h in all_headers]
-            
-            # Find the columns we need
-            required_columns = ['Name', 'Device Name', 'Direction', 'Default', 
-                               'Default Multimedia', 'Default Communications', 
-                               'Volume Percent', 'Command-Line Friendly ID']
-            
-            column_indices = {}
-            for col in required_columns:
-                try:
-                    column_indices[col] = all_headers.index(col)
-                except ValueError:
-                    logger.warning(f"Column '{col}' not found in svcl.exe output")
-            
-            # Parse data rows
+            # Parse data rows. svcl.exe only quotes fields that contain commas,
+            # so plain splitting is safe unless a quote appears anywhere. Stop
+            # splitting after the last column we read; the remainder of the
+            # line is left as a single unused field
             rows = []
-            csv_reader = csv.reader(data_lines)
-            
-            for row_data in csv_reader:
-                if len(row_data) > max(column_indices.values(), default=-1):
-                    row = {}
-                    for col_name, col_index in column_indices.items():
-                        row[col_name] = row_data[col_index] if col_index < len(row_data) else ""
-                    rows.append(row)
+            last_index = max(column_indices.values(), default=-1)
+            if b'"' not in csv_bytes:
+                for line in data_lines:
+                    fields = line.split(b',', last_index + 1)
+                    if len(fields) > last_index:
+                        rows.append({col_name: fields[col_index].decode('utf-8', 'replace')
+                                     for col_name, col_index in column_indices.items()})
+            else:
+                import csv
+                decoded_lines = (line.decode('utf-8', 'replace') for line in data_lines)
+                for row_data in csv.reader(decoded_lines):
+                    if len(row_data) > last_index:
+                        rows.append({col_name: row_data[col_index]
+                                     for col_name, col_index in column_indices.items()})
             
             logger.debug(f"Parsed {len(rows)} audio devices")
-            return {"ok": True, "rows": rows, "headers": list(required_columns)}
+            self._devices_cache = {"ok": True, "rows": rows, "headers": list(self.REQUIRED_COLUMNS)}
+            self._devices_cache_ts = time.monotonic()
+            return self._devices_cache
             
         except Exception as e:
             logger.error(f"Error getting device information: {e}")
             return {"ok": False, "rows": [], "error": str(e)}
     
+    def _iter_playback_devices(self, rows: List[Dict[str, str]]) -> Iterator[PlaybackDevice]:
+        """Lazily build render devices from get_devices_raw rows"""
+        for device in rows:
+            direction = device.get("Direction", "").lower()
+            if direction == "render":
+                yield PlaybackDevice(
+                    name=device.get("Name", ""),
+                    device_name=device.get("Device Name", ""),
+                    direction="Render",
+                    default=device.get("Default", ""),
+                    default_multimedia=device.get("Default Multimedia", ""),
+                    default_communications=device.get("Default Communications", ""),
+                    volume_percent=self._parse_volume(device.get("Volume Percent", "")),
+                    device_id=clean_audio_device_id(device.get("Command-Line Friendly ID", ""))
+                )
+    
+    def iter_playback_devices(self) -> Iterator[PlaybackDevice]:
+        """Yield playback devices one at a time; yields nothing if enumeration fails"""
+        return self._iter_playback_devices(self.get_devices_raw()["rows"])
+    
     def get_playback_devices(self) -> Dict[str, Any]:
         """Get list of playback (render) devices"""
         raw_data = self.get_devices_raw()
         if not raw_data["ok"]:
             return raw_data
         
-        playback_devices = []
-        for device in raw_data["rows"]:
-            direction = device.get("Direction", "").lower()
-            if direction == "render":
-                # Clean up the device data
-                clean_device = {
-                    "name": device.get("Name", ""),
-                    "device_name": device.get("Device Name", ""),
-                    "direction": "Render",
-                    "default": device.get("Default", ""),
-                    "default_multimedia": device.get("Default Multimedia", ""),
-                    "default_communications": device.get("Default Communications", ""),
-                    "volume_percent": self._parse_volume(device.get("Volume Percent", "")),
-                    "device_id": clean_audio_device_id(device.get("Command-Line Friendly ID", ""))
-                }
-                playback_devices.append(clean_device)
-        
+        playback_devices = [device.to_dict() for device in self._iter_playback_devices(raw_data["rows"])]
         return {
             "ok": True,
             "devices": playback_devices,
@@ -154,10 +336,25 @@ class AudioController:
         if not volume_str:
             return None
         
+        volume_str = str(volume_str)
+        
+        # Common case: svcl.exe reports a bare integer or float
+        try:
+            return max(0, min(100, int(volume_str)))
+        except ValueError:
+            pass
         try:
+            return max(0, min(100, int(round(float(volume_str)))))
+        except (ValueError, OverflowError):
+            pass
+        
+        try:
+            match = _VOLUME_FLOAT_RE.match(volume_str)
+            if match:
+                return max(0, min(100, int(round(float(match.group(1))))))
+            
             # Remove non-numeric characters except decimal point
-            import re
-            volume_clean = re.sub(r'[^\d\.]', '', str(volume_str))
+            volume_clean = _VOLUME_STRIP_RE.sub('', volume_str)
             if volume_clean:
                 volume_float = float(volume_clean)
                 return max(0, min(100, int(round(volume_float))))
@@ -166,8 +363,52 @@ class AudioController:
         
         return None
     
+    def _get_default_column(self, column: str) -> str:
+        """Read a single column value for the default render device"""
+        result = self._run_svcl(['/Stdout', '/GetColumnValue', 'DefaultRenderDevice', column],
+                                want_stderr=False)
+        if result.returncode != 0:
+            return ""
+        return result.stdout.strip()
+    
+    def _get_all_state_once(self) -> Tuple[Optional[Dict[str, str]], List[Dict[str, str]]]:
+        """Return (default render row, all rows) from a single /scomma dump"""
+        raw_data = self.get_devices_raw()
+        if not raw_data["ok"]:
+            return None, []
+        
+        rows = raw_data["rows"]
+        for row in rows:
+            if (row.get("Direction", "").lower() == "render" and
+                    "render" in row.get("Default", "").lower()):
+                return row, rows
+        return None, rows
+    
     def get_current_default_device(self) -> Dict[str, Any]:
         """Get current default render device information"""
+        try:
+            # The /scomma dump already carries the default flag, names and
+            # volume, so one (cached) svcl.exe run answers everything
+            default_row, _ = self._get_all_state_once()
+            if default_row is not None:
+                device_id = clean_audio_device_id(default_row.get("Command-Line Friendly ID", ""))
+                if device_id:
+                    return {
+                        "ok": True,
+                        "device_id": device_id,
+                        "device_name": default_row.get("Device Name") or None,
+                        "name": default_row.get("Name") or None,
+                        "volume": self._parse_volume(default_row.get("Volume Percent", ""))
+                    }
+            
+            return self._query_default_device()
+            
+        except Exception as e:
+            logger.error(f"Error getting current default device: {e}")
+            return {"ok": False, "error": str(e)}
+    
+    def _query_default_device(self) -> Dict[str, Any]:
+        """Query the default render device column by column (dump fallback)"""
         try:
             # Use GetColumnValue to get default device ID
             result = self._run_svcl(['/Stdout', '/GetColumnValue', 'DefaultRenderDevice', 'Command-Line Friendly ID'])
@@ -180,24 +421,28 @@ class AudioController:
                 return {"ok": False, "error": "No default render device found"}
             
             # Get volume for default device
-            volume_result = self._run_svcl(['/Stdout', '/GetPercent', 'DefaultRenderDevice'])
+            volume_result = self._run_svcl(['/Stdout', '/GetPercent', 'DefaultRenderDevice'],
+                                           want_stderr=False)
             volume = None
             if volume_result.returncode == 0:
                 volume = self._parse_volume(volume_result.stdout.strip())
             
-            # Try to get device details from device list
-            devices_info = self.get_playback_devices()
-            device_name = None
-            name = None
-            
-            if devices_info["ok"]:
-                for device in devices_info["devices"]:
-                    if device["device_id"].lower() == device_id.lower():
-                        device_name = device["device_name"]
-                        name = device["name"]
-                        if volume is None:
-                            volume = device["volume_percent"]
-                        break
+            # Ask svcl.exe for the name columns directly rather than dumping
+            # and parsing the whole device list
+            name = self._get_default_column('Name') or None
+            device_name = self._get_default_column('Device Name') or None
+            
+            # Fall back to the full device list only if the direct lookups failed
+            if not device_name and not name:
+                # Stop parsing rows as soon as the default device turns up
+                target_id = device_id.casefold()
+                device = next((d for d in self.iter_playback_devices()
+                               if d.device_id.casefold() == target_id), None)
+                if device is not None:
+                    device_name = device.device_name
+                    name = device.name
+                    if volume is None:
+                        volume = device.volume_percent
             
             # If no device name found, try to extract from device ID
             if not device_name and device_id:
@@ -234,6 +479,7 @@ class AudioController:
                 logger.error(f"Failed to set default device: {result.stderr}")
                 return False
             
+            self.invalidate_cache()
             logger.info(f"Set default device to: {device_id} (role: {role})")
             return True
             
@@ -241,11 +487,50 @@ class AudioController:
             logger.error(f"Error setting default device: {e}")
             return False
     
+    def _run_on_default_endpoint(self, fn) -> Tuple[bool, Any]:
+        """Run fn(IAudioEndpointVolume) for the default render device via pycaw
+        
+        Returns (True, result), or (False, None) when pycaw is unavailable or
+        the call failed, so callers can fall back to svcl.exe.
+        """
+        if not self._pycaw_available:
+            return False, None
+        
+        if self._core_audio is None:
+            try:
+                import comtypes  # noqa: F401
+                import pycaw.pycaw  # noqa: F401
+            except ImportError:
+                logger.debug("pycaw not installed, using svcl.exe for volume control")
+                self._pycaw_available = False
+                return False, None
+            self._core_audio = _CoreAudioThread()
+        
+        try:
+            return True, self._core_audio.call(fn)
+        except Exception as e:
+            logger.debug(f"pycaw call failed, falling back to svcl.exe: {e}")
+            return False, None
+    
     def set_volume(self, percent: int, device_id: Optional[str] = None) -> bool:
         """Set volume for device (default device if not specified)"""
         if percent < 0 or percent > 100:
             raise ValueError("Volume percent must be between 0 and 100")
         
+        with self._volume_apply_lock:
+            return self._apply_volume(percent, device_id)
+    
+    def _apply_volume(self, percent: int, device_id: Optional[str]) -> bool:
+        """Set the volume; callers hold _volume_apply_lock"""
+        # Default device volume can be set in-process without spawning svcl.exe
+        if not device_id:
+            ok, _ = self._run_on_default_endpoint(
+                lambda endpoint: endpoint.SetMasterVolumeLevelScalar(percent / 100.0, None))
+            if ok:
+                self.invalidate_cache()
+                logger.info(f"Set volume to {percent}% for device: DefaultRenderDevice (pycaw)")
+                return True
+        
         try:
             target = device_id if device_id else "DefaultRenderDevice"
             result = self._run_svcl(['/SetVolume', target, str(percent)])
@@ -254,6 +539,7 @@ class AudioController:
                 logger.error(f"Failed to set volume: {result.stderr}")
                 return False
             
+            self.invalidate_cache()
             logger.info(f"Set volume to {percent}% for device: {target}")
             return True
             
@@ -261,14 +547,73 @@ class AudioController:
             logger.error(f"Error setting volume: {e}")
             return False
     
+    def set_volume_debounced(self, percent: int, device_id: Optional[str] = None,
+                             delay: float = 0.05) -> Optional[bool]:
+        """Set volume, coalescing bursts of calls (e.g. a dragged slider)
+        
+        The first call of a burst is applied immediately and its result
+        returned. Calls arriving within ``delay`` seconds return None: they
+        are queued per device and only the latest value for each device is
+        applied when the window closes. Values are applied one at a time and
+        an older value never overwrites a newer one.
+        """
+        if percent < 0 or percent > 100:
+            raise ValueError("Volume percent must be between 0 and 100")
+        
+        with self._volume_lock:
+            self._volume_seq += 1
+            seq = self._volume_seq
+            if self._volume_timer is not None:
+                self._pending_volume[device_id] = (seq, percent)
+                return None
+            
+            self._volume_timer = threading.Timer(delay, self._flush_volume)
+            self._volume_timer.daemon = True
+            self._volume_timer.start()
+        
+        return self._apply_volume_in_order(seq, percent, device_id)
+    
+    def _apply_volume_in_order(self, seq: int, percent: int,
+                               device_id: Optional[str]) -> Optional[bool]:
+        """Apply a debounced value unless a newer one for the device already was"""
+        with self._volume_apply_lock:
+            if seq < self._applied_volume_seq.get(device_id, 0):
+                return None
+            self._applied_volume_seq[device_id] = seq
+            return self.set_volume(percent, device_id)
+    
+    def _flush_volume(self) -> None:
+        """Apply the latest volume queued for each device by set_volume_debounced"""
+        with self._volume_lock:
+            pending = self._pending_volume
+            self._pending_volume = {}
+            self._volume_timer = None
+        
+        for device_id, (seq, percent) in pending.items():
+            self._apply_volume_in_order(seq, percent, device_id)
+    
     def get_current_volume(self, device_id: Optional[str] = None) -> Optional[int]:
         """Get current volume for device"""
         try:
+            if not device_id:
+                # In-process read via pycaw when available
+                ok, scalar = self._run_on_default_endpoint(
+                    lambda endpoint: endpoint.GetMasterVolumeLevelScalar())
+                if ok:
+                    return max(0, min(100, int(round(scalar * 100))))
+                
+                # Otherwise reuse the (cached) device dump for the default device
+                default_row, _ = self._get_all_state_once()
+                if default_row is not None:
+                    volume = self._parse_volume(default_row.get("Volume Percent", ""))
+                    if volume is not None:
+                        return volume
+            
             target = device_id if device_id else "DefaultRenderDevice"
-            result = self._run_svcl(['/Stdout', '/GetPercent', target])
+            result = self._run_svcl(['/Stdout', '/GetPercent', target], want_stderr=False)
             
             if result.returncode != 0:
-                logger.error(f"Failed to get volume: {result.stderr}")
+                logger.error(f"Failed to get volume: svcl.exe exited with code {result.returncode}")
                 return None
             
             return self._parse_volume(result.stdout.strip())
@@ -277,9 +622,44 @@ class AudioController:
             logger.error(f"Error getting volume: {e}")
             return None
     
+    def _build_mapping_index(self, device_mappings: List[Dict[str, Any]]) -> _MappingIndex:
+        """Build (or reuse) label/device_id lookup tables for the mappings"""
+        signature = tuple(
+            (m.get("label", ""), m.get("device_id", ""), bool(m.get("use_for_streaming", False)))
+            for m in device_mappings
+        )
+        cached = self._mapping_index
+        if cached is not None and cached[0] == signature:
+            return cached[1]
+        
+        by_label: Dict[str, str] = {}
+        by_device_id: Dict[str, str] = {}
+        streaming_id = None
+        for mapping in device_mappings:
+            label = mapping.get("label", "")
+            device_id = mapping.get("device_id", "").strip()
+            # First mapping wins, matching the order mappings are configured in
+            by_label.setdefault(label.strip().casefold(), device_id)
+            if device_id:
+                by_device_id.setdefault(device_id.casefold(), mapping.get("label", "unknown"))
+            if streaming_id is None and mapping.get("use_for_streaming", False):
+                streaming_id = device_id
+        
+        index = _MappingIndex(by_label, by_device_id, streaming_id)
+        self._mapping_index = (signature, index)
+        return index
+    
     def get_audio_snapshot(self, device_mappings: List[Dict[str, Any]]) -> Dict[str, Any]:
         """Get comprehensive audio status snapshot"""
         try:
+            # Polls between device changes see the same cached dump and the
+            # same mappings, so the previous snapshot is still accurate
+            raw_data = self.get_devices_raw()
+            mapping_index = self._build_mapping_index(device_mappings or [])
+            last = self._last_snapshot
+            if last is not None and last[0] is raw_data and last[1] is mapping_index:
+                return dict(last[2])
+            
             # Get current default device
             current_device = self.get_current_default_device()
             if not current_device["ok"]:
@@ -296,15 +676,12 @@ class AudioController:
             active_key = "unknown"
             matched = False
             
-            if device_mappings:
-                for mapping in device_mappings:
-                    mapping_id = mapping.get("device_id", "").strip()
-                    if mapping_id and mapping_id.lower() == device_id.lower():
-                        active_key = mapping.get("label", "unknown")
-                        matched = True
-                        break
+            label = mapping_index.by_device_id.get(device_id.casefold())
+            if label is not None:
+                active_key = label
+                matched = True
             
-            return {
+            snapshot = {
                 "ok": True,
                 "device_id": device_id,
                 "device_name": current_device["device_name"],
@@ -313,6 +690,9 @@ class AudioController:
                 "active_key": active_key,
                 "matched": matched
             }
+            if raw_data["ok"]:
+                self._last_snapshot = (raw_data, mapping_index, snapshot)
+            return dict(snapshot)
             
         except Exception as e:
             logger.error(f"Error getting audio snapshot: {e}")
@@ -325,11 +705,7 @@ class AudioController:
     def switch_to_device_by_key(self, key: str, device_mappings: List[Dict[str, Any]]) -> Dict[str, Any]:
         """Switch to audio device by mapping key"""
         # Find device ID by key
-        device_id = None
-        for mapping in device_mappings:
-            if mapping.get("label", "").strip().lower() == key.strip().lower():
-                device_id = mapping.get("device_id", "").strip()
-                break
+        device_id = self._build_mapping_index(device_mappings).by_label.get(key.strip().casefold())
         
         if not device_id:
             return {
@@ -353,10 +729,7 @@ class AudioController:
     
     def get_streaming_device_id(self, device_mappings: List[Dict[str, Any]]) -> Optional[str]:
         """Get device ID marked for streaming services"""
-        for mapping in device_mappings:
-            if mapping.get("use_for_streaming", False):
-                return mapping.get("device_id", "").strip()
-        return None
+        return self._build_mapping_index(device_mappings).streaming_id
     
     def switch_to_streaming_device(self, device_mappings: List[Dict[str, Any]]) -> Dict[str, Any]:
         """Switch to the device configured for streaming services"""
@@ -384,6 +757,10 @@ class AudioController:
     def test_audio_system(self) -> Dict[str, Any]:
         """Test audio system and return diagnostic information"""
         try:
+            # Start from a fresh dump; the probes below then share that single
+            # svcl.exe run instead of spawning one process each
+            self.invalidate_cache()
+            
             # Test basic device enumeration
             devices = self.get_playback_devices()
             
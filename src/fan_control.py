@@ -10,33 +10,216 @@ Disclaimer: Provided AS IS. See README.md 'AS IS Disclaimer' for details.
 """
 
 import os
+import re
 import time
+import select
+import threading
 import logging
 import subprocess
+from array import array
+from bisect import bisect_left
+from collections import deque
 import psutil
-from typing import Dict, List, Optional, Any
+from typing import Dict, List, NamedTuple, Optional, Tuple, Any
 from src.utils import run_subprocess_safe, safe_kill_process_by_name, is_admin
+from src.win_processes import find_process_ids, wait_for_exit
 
 logger = logging.getLogger(__name__)
 
+# FanControl's process name. Both the native Windows lookup and the psutil
+# fallback match it exactly, ignoring case, so they find the same processes
+_FC_EXE_NAME = 'FanControl.exe'
+_FC_EXE_NAME_LOWER = _FC_EXE_NAME.lower()
+
+# First 1-3 digit number in a config name is treated as its fan percentage
+_PCT_RE = re.compile(r'(\d{1,3})')
+# Percentage stored for configs without one, so they sort after 0-100
+_NO_PCT = 101
+# Editing a config in place doesn't touch the directory stat, so rescan at
+# least this often to keep per-file sizes and mtimes from going stale
+_CONFIG_MAX_AGE = 60.0
+# The exe and config paths rarely disappear, so a path found on disk is
+# trusted for this long; missing paths are checked again on every call
+_PATH_CHECK_TTL = 30.0
+
+
+_shell_module = None
+
+
+def _get_shell():
+    """Import win32com's shell module on first use, remembering a failed import
+    
+    Returns None without pywin32. A failed import would otherwise search
+    sys.path again on every call.
+    """
+    global _shell_module
+    if _shell_module is None:
+        try:
+            import win32com.shell.shell as shell
+            _shell_module = shell
+        except ImportError:
+            _shell_module = False
+    return _shell_module or None
+
+
+def _spawn_detached(args: List[str], creationflags: int = 0) -> None:
+    """Launch a long-lived process we never wait on or talk to
+    
+    The child gets no stdio handles from us and no inherited descriptors,
+    and the Popen object is dropped right away.
+    """
+    subprocess.Popen(args,
+                     creationflags=creationflags,
+                     stdin=subprocess.DEVNULL,
+                     stdout=subprocess.DEVNULL,
+                     stderr=subprocess.DEVNULL,
+                     close_fds=True)
+
+
+def _pidfd_wait(pids: List[int], timeout: float) -> Optional[bool]:
+    """Wait for processes to exit using Linux pidfds, woken by the kernel on exit
+    
+    Returns True when all have exited, False on timeout, or None when pidfds
+    are unavailable.
+    """
+    pidfd_open = getattr(os, 'pidfd_open', None)
+    if pidfd_open is None:
+        return None
+    
+    fds = []
+    try:
+        for pid in pids:
+            try:
+                fds.append(pidfd_open(pid))
+            except ProcessLookupError:
+                continue  # Already exited
+        
+        poller = select.poll()
+        for fd in fds:
+            poller.register(fd, select.POLLIN)
+        pending = len(fds)
+        deadline = time.monotonic() + timeout
+        while pending:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return False
+            for fd, _ in poller.poll(remaining * 1000):
+                poller.unregister(fd)
+                pending -= 1
+        return True
+    
+    except OSError as e:
+        logger.debug(f"pidfd wait failed: {e}")
+        return None
+    finally:
+        for fd in fds:
+            os.close(fd)
+
+
+class _ConfigTable(NamedTuple):
+    """Config directory listing stored column-wise, sorted by (percentage, name)"""
+    key: Optional[Tuple[str, int, int]]
+    names: List[str]
+    paths: List[str]
+    pcts: array     # signed 16-bit, _NO_PCT when the name has no percentage
+    sizes: array
+    mtimes: array
+    n_pct: int      # leading rows that have a percentage
+    scanned_at: float = 0.0
+    
+    def row(self, i: int) -> Dict[str, Any]:
+        """Build the public dict view of one config"""
+        pct = self.pcts[i]
+        name = self.names[i]
+        return {
+            "name": name,
+            "filename": name + '.json',
+            "filepath": self.paths[i],
+            "percentage": None if pct == _NO_PCT else pct,
+            "size": self.sizes[i],
+            "modified": self.mtimes[i]
+        }
+
+
+_EMPTY_TABLE = _ConfigTable(None, [], [], array('h'), array('q'), array('d'), 0)
+
 class FanController:
     """Controls fan profiles via FanControl.exe"""
     
-    def __init__(self, fan_exe_path: str, fan_config_path: str):
-        """Initialize fan controller with paths"""
+    def __init__(self, fan_exe_path: str, fan_config_path: str, refresh_min_interval: float = 1.0):
+        """Initialize fan controller with paths
+        
+        refresh_min_interval is the minimum time in seconds between sensor
+        refreshes sent to FanControl; requests inside it reuse the last one.
+        """
         self.fan_exe_path = fan_exe_path.strip() if fan_exe_path else ""
         self.fan_config_path = fan_config_path.strip() if fan_config_path else ""
         
-        if self.fan_exe_path and not os.path.exists(self.fan_exe_path):
+        # Frequent sensor pokes keep the CPU from idling and skew the very
+        # readings being refreshed, so successful refreshes are rate limited
+        self.refresh_min_interval = refresh_min_interval
+        self._last_refresh = float('-inf')
+        
+        # Short-lived cache of the FanControl process scan; psutil enumeration
+        # is slow on Windows and several calls often happen back to back
+        self._proc_cache = (0.0, [])
+        self._proc_cache_ttl = 0.25
+        # Last FanControl process seen, revalidated with is_running() so
+        # repeated lookups don't rebuild a psutil.Process for the same PID
+        self._fc_proc: Optional[psutil.Process] = None
+        # Handles from the last scan by PID; they outlive the scan TTL and are
+        # reused when the PID shows up again. is_running() compares the create
+        # time, so a recycled PID gets a fresh handle
+        self._proc_handles: Dict[int, psutil.Process] = {}
+        
+        # Recent FanControl start/stop latencies, used to place status polls
+        self._start_latencies = deque(maxlen=32)
+        self._stop_latencies = deque(maxlen=32)
+        
+        # Config listing columns, plus the dict view and name index built
+        # from them on demand; all keyed by the directory stat
+        self._cfg_table = _EMPTY_TABLE
+        self._cfg_view = (None, [])
+        self._names_index = (None, {})
+        
+        # path -> time it was last found on disk (see _path_exists)
+        self._exists_cache: Dict[str, float] = {}
+        
+        # Coalescing state for concurrent switch_config calls
+        self._switch_cond = threading.Condition()
+        self._switch_running = False
+        self._pending_target = None
+        self._switch_requested = 0
+        self._switch_completed = 0
+        self._last_switch_result = False
+        
+        if self.fan_exe_path and not self._path_exists(self.fan_exe_path):
             logger.warning(f"FanControl.exe not found at: {self.fan_exe_path}")
         
-        if self.fan_config_path and not os.path.exists(self.fan_config_path):
+        if self.fan_config_path and not self._path_exists(self.fan_config_path):
             logger.warning(f"Fan config directory not found at: {self.fan_config_path}")
     
+    def _path_exists(self, path: str) -> bool:
+        """os.path.exists, with hits memoized per path for _PATH_CHECK_TTL seconds
+        
+        Misses are never memoized, so installing FanControl or creating the
+        config directory is picked up on the next call.
+        """
+        if not path:
+            return False
+        now = time.monotonic()
+        found_at = self._exists_cache.get(path)
+        if found_at is not None and now - found_at < _PATH_CHECK_TTL:
+            return True
+        if os.path.exists(path):
+            self._exists_cache[path] = now
+            return True
+        self._exists_cache.pop(path, None)
+        return False
+    
     def is_configured(self) -> bool:
         """Check if fan control is properly configured"""
-        return (bool(self.fan_exe_path and os.path.exists(self.fan_exe_path)) and
-                bool(self.fan_config_path and os.path.exists(self.fan_config_path)))
+        return self._path_exists(self.fan_exe_path) and self._path_exists(self.fan_config_path)
     
     def requires_admin(self) -> bool:
         """Check if fan control requires admin privileges"""
@@ -46,31 +229,146 @@ class FanController:
         """Check if config switching is available (requires admin privileges)"""
         return self.is_configured() and is_admin()
     
-    def get_fancontrol_processes(self) -> List[psutil.Process]:
+    def _invalidate_proc_cache(self) -> None:
+        """Forget the cached process scan after starting or stopping FanControl"""
+        self._proc_cache = (0.0, [])
+        self._fc_proc = None
+    
+    def _wait_until(self, predicate, timeout: float, initial: float = 0.05,
+                    max_interval: float = 0.5, history: Optional[deque] = None) -> bool:
+        """Poll predicate with growing intervals until it holds or timeout expires
+        
+        When a history of past latencies is given, the first polls are placed
+        at its median and 90th percentile, where the change is most likely to
+        have happened, before falling back to backoff. Successful waits are
+        recorded back into the history.
+        """
+        start = time.monotonic()
+        deadline = start + timeout
+        delay = initial
+        checkpoints = []
+        if history is not None and len(history) >= 4:
+            ordered = sorted(history)
+            checkpoints = [ordered[len(ordered) // 2], ordered[int(0.9 * (len(ordered) - 1))]]
+        
+        while True:
+            if predicate():
+                if history is not None:
+                    history.append(time.monotonic() - start)
+                return True
+            now = time.monotonic()
+            remaining = deadline - now
+            if remaining <= 0:
+                return False
+            while checkpoints and start + checkpoints[0] <= now:
+                checkpoints.pop(0)
+            if checkpoints:
+                time.sleep(min(start + checkpoints.pop(0) - now, remaining))
+            else:
+                time.sleep(min(delay, remaining))
+                delay = min(delay * 1.7, max_interval)
+    
+    def _fresh_processes(self) -> List[psutil.Process]:
+        """Get FanControl processes from a new scan rather than the cache"""
+        self._invalidate_proc_cache()
+        return self.get_fancontrol_processes()
+    
+    def _poll_running(self) -> bool:
+        """Check whether FanControl is running, bypassing the cache"""
+        self._invalidate_proc_cache()
+        return self.is_running()
+    
+    def get_fancontrol_processes(self, force: bool = False) -> List[psutil.Process]:
         """Get all running FanControl processes"""
+        now = time.monotonic()
+        cached_at, cached = self._proc_cache
+        if not force and now - cached_at < self._proc_cache_ttl:
+            return [p for p in cached if p.is_running()]
+        
+        # On Windows, find the PIDs natively and only build psutil objects for
+        # the matches; elsewhere (or if that fails) scan with psutil
+        pids = find_process_ids(_FC_EXE_NAME)
+        if pids is not None:
+            processes = []
+            for pid in pids:
+                known = self._proc_handles.get(pid)
+                if known is not None and known.is_running():
+                    processes.append(known)
+                    continue
+                try:
+                    processes.append(psutil.Process(pid))
+                except psutil.NoSuchProcess:
+                    continue
+            self._remember_processes(now, processes)
+            return processes
+        
         processes = []
         try:
-            for proc in psutil.process_iter(['pid', 'name', 'exe']):
+            # Only the name is needed to filter (pid is always set on the
+            # handle); exe() is resolved later for the few matches instead of
+            # for every process on the system
+            for proc in psutil.process_iter(attrs=['name']):
                 try:
-                    if proc.info['name'] and 'fancontrol' in proc.info['name'].lower():
+                    name = proc.info['name']
+                    if name and name.lower() == _FC_EXE_NAME_LOWER:
                         processes.append(proc)
                 except (psutil.NoSuchProcess, psutil.AccessDenied):
                     continue
         except Exception as e:
             logger.debug(f"Error enumerating processes: {e}")
         
+        self._remember_processes(now, processes)
         return processes
     
+    def _remember_processes(self, now: float, processes: List[psutil.Process]) -> None:
+        """Cache a scan result and keep its handles for reuse by PID"""
+        self._proc_cache = (now, processes)
+        self._proc_handles = {p.pid: p for p in processes}
+    
+    def _any_fancontrol_process(self) -> bool:
+        """Check for a FanControl process, stopping at the first match"""
+        known = self._fc_proc
+        if known is not None and known.is_running():
+            return True
+        
+        cached_at, cached = self._proc_cache
+        if time.monotonic() - cached_at < self._proc_cache_ttl:
+            return any(p.is_running() for p in cached)
+        
+        # Native lookup stops at the first PID and builds no Process objects
+        pids = find_process_ids(_FC_EXE_NAME, first_only=True)
+        if pids is not None:
+            return bool(pids)
+        
+        try:
+            for proc in psutil.process_iter(attrs=['name']):
+                name = proc.info['name']
+                if name and name.lower() == _FC_EXE_NAME_LOWER:
+                    return True
+        except Exception as e:
+            logger.debug(f"Error enumerating processes: {e}")
+        return False
+    
     def is_running(self) -> bool:
         """Check if FanControl is currently running"""
-        return len(self.get_fancontrol_processes()) > 0
+        return self._any_fancontrol_process()
+    
+    def _current_fc_proc(self) -> Optional[psutil.Process]:
+        """Get the running FanControl process, reusing the last handle while it lives"""
+        known = self._fc_proc
+        if known is not None and known.is_running():
+            return known
+        
+        processes = self.get_fancontrol_processes()
+        self._fc_proc = processes[0] if processes else None
+        return self._fc_proc
     
     def get_running_exe_path(self) -> Optional[str]:
         """Get the path of the running FanControl.exe"""
-        processes = self.get_fancontrol_processes()
-        if processes:
+        proc = self._current_fc_proc()
+        if proc is not None:
             try:
-                return processes[0].exe()
+                return proc.exe()
             except (psutil.NoSuchProcess, psutil.AccessDenied):
                 pass
         return self.fan_exe_path if self.fan_exe_path else None
@@ -86,28 +384,32 @@ class FanController:
                 try:
                     if not force:
                         proc.terminate()
-                        proc.wait(timeout=3)
                     else:
                         proc.kill()
-                except (psutil.NoSuchProcess, psutil.TimeoutExpired):
+                except psutil.NoSuchProcess:
                     continue
-           
-            time.sleep(0.5)
-            remaining = self.get_fancontrol_processes()
             
-            if remaining and not force:
+            # Wait on the handles we already hold, with one shared budget per
+            # step that ends as soon as the processes exit, and escalate on
+            # whatever is still running rather than re-enumerating processes
+            self._wait_for_exit(processes, timeout=1.0 if force else 3.0)
+            remaining = self._still_running(processes)
+            
+            if remaining:
                 for proc in remaining:
                     try:
                         proc.kill()
                     except (psutil.NoSuchProcess, psutil.AccessDenied):
                         continue
-                
-                time.sleep(0.2)
+                self._wait_for_exit(remaining, timeout=1.0)
+                remaining = self._still_running(remaining)
             
-            if self.get_fancontrol_processes():
-                safe_kill_process_by_name("FanControl.exe")
-                time.sleep(0.2)
+            if remaining:
+                safe_kill_process_by_name(_FC_EXE_NAME)
+                self._wait_for_exit(remaining, timeout=1.0)
             
+            # Single re-enumeration as a sanity check (also catches new instances)
+            self._invalidate_proc_cache()
             success = len(self.get_fancontrol_processes()) == 0
             if success:
                 logger.info("FanControl stopped successfully")
@@ -117,9 +419,37 @@ class FanController:
             logger.error(f"Error stopping FanControl: {e}")
             return False
     
+    @staticmethod
+    def _still_running(processes: List[psutil.Process]) -> List[psutil.Process]:
+        """Return the processes whose handles are still alive"""
+        alive = []
+        for proc in processes:
+            try:
+                if proc.is_running():
+                    alive.append(proc)
+            except psutil.Error:
+                continue
+        return alive
+    
+    def _wait_for_exit(self, processes: List[psutil.Process], timeout: float) -> bool:
+        """Wait until all processes have exited or the timeout expires"""
+        processes = self._still_running(processes)
+        if not processes:
+            return True
+        
+        # Kernel exit notifications where available, psutil polling otherwise
+        pids = [p.pid for p in processes]
+        exited = wait_for_exit(pids, int(timeout * 1000))
+        if exited is None:
+            exited = _pidfd_wait(pids, timeout)
+        if exited is None:
+            _, alive = psutil.wait_procs(processes, timeout=timeout)
+            exited = not alive
+        return exited
+    
     def start_fancontrol(self, minimized: bool = True, config_path: Optional[str] = None) -> bool:
         """Start FanControl.exe"""
-        if not self.fan_exe_path or not os.path.exists(self.fan_exe_path):
+        if not self._path_exists(self.fan_exe_path):
             raise RuntimeError(f"FanControl.exe not found: {self.fan_exe_path}")
         
         try:
@@ -133,12 +463,11 @@ class FanController:
                 logger.info("Starting FanControl unelevated from admin context")
                 self._start_unelevated(args)
             else:
-                subprocess.Popen(args, 
-                               creationflags=subprocess.CREATE_NO_WINDOW if not minimized else 0)
+                _spawn_detached(args, subprocess.CREATE_NO_WINDOW if not minimized else 0)
+            self._invalidate_proc_cache()
             
-            time.sleep(0.5)
-            
-            success = self.is_running()
+            success = self._wait_until(self._poll_running, timeout=0.5,
+                                       history=self._start_latencies)
             if success:
                 logger.info(f"FanControl started successfully (minimized: {minimized})")
             return success
@@ -149,20 +478,22 @@ class FanController:
     
     def _start_unelevated(self, args: List[str]) -> None:
         """Start process unelevated (for admin contexts)"""
+        shell = _get_shell()
+        if shell is None:
+            _spawn_detached(args)
+            return
+        
         try:
-            import win32com.shell.shell as shell
-            
             exe_path = args[0]
-            exe_args = ' '.join(args[1:]) if len(args) > 1 else ""
+            # Quote like Popen does, so config paths with spaces stay one argument
+            exe_args = subprocess.list2cmdline(args[1:])
             working_dir = os.path.dirname(exe_path)
             
             shell.ShellExecute(exe_path, exe_args, working_dir, 'open', 0)
             
-        except ImportError:
-            subprocess.Popen(args)
         except Exception as e:
             logger.warning(f"Unelevated start failed, using normal start: {e}")
-            subprocess.Popen(args)
+            _spawn_detached(args)
     
     def ensure_running(self) -> bool:
         """Ensure FanControl is running, start if needed"""
@@ -180,10 +511,53 @@ class FanController:
         return self.start_fancontrol(minimized=True, config_path=config_path)
     
     def switch_config(self, config_path: str) -> bool:
-        """Switch to a different config (uses config file replacement strategy)"""
+        """Switch to a different config (uses config file replacement strategy)
+        
+        Concurrent calls are coalesced: while a switch is running, new
+        requests only replace the pending target, and the running caller
+        applies the latest one when it finishes. Superseded callers wait and
+        return the result of the switch that covered their request.
+        """
         if not os.path.exists(config_path):
             raise RuntimeError(f"Config file not found: {config_path}")
         
+        with self._switch_cond:
+            self._switch_requested += 1
+            ticket = self._switch_requested
+            self._pending_target = config_path
+            if self._switch_running:
+                while self._switch_completed < ticket:
+                    self._switch_cond.wait()
+                return self._last_switch_result
+            self._switch_running = True
+        
+        result = False
+        try:
+            while True:
+                with self._switch_cond:
+                    target = self._pending_target
+                    covered = self._switch_requested
+                    self._pending_target = None
+                    if target is None:
+                        self._switch_running = False
+                        return result
+                result = self._switch_config_now(target)
+                with self._switch_cond:
+                    self._last_switch_result = result
+                    self._switch_completed = covered
+                    self._switch_cond.notify_all()
+        except BaseException:
+            with self._switch_cond:
+                # Release waiters so they don't block forever
+                self._switch_running = False
+                self._pending_target = None
+                self._last_switch_result = False
+                self._switch_completed = self._switch_requested
+                self._switch_cond.notify_all()
+            raise
+    
+    def _switch_config_now(self, config_path: str) -> bool:
+        """Switch to a config immediately"""
         try:
             if self.is_running():
                 return self._switch_config_by_replacement(config_path)
@@ -206,20 +580,23 @@ class FanController:
             if not exe_path:
                 exe_path = self.fan_exe_path
             
-            if not exe_path or not os.path.exists(exe_path):
+            if not self._path_exists(exe_path):
                 logger.error(f"FanControl.exe not found: {exe_path}")
                 return False
             
             logger.info("Stopping FanControl using -e command")
             try:
+                # Output is only of interest on failure, so discard stdout and
+                # decode stderr only when it will be logged
                 result = subprocess.run([exe_path, '-e'], 
-                                      capture_output=True, 
-                                      text=True, 
+                                      stdout=subprocess.DEVNULL,
+                                      stderr=subprocess.PIPE,
                                       timeout=10,
                                       creationflags=subprocess.CREATE_NO_WINDOW)
                 
                 if result.returncode != 0:
-                    logger.warning(f"FanControl -e returned code {result.returncode}: {result.stderr}")
+                    stderr = result.stderr.decode('utf-8', errors='replace')
+                    logger.warning(f"FanControl -e returned code {result.returncode}: {stderr}")
                 else:
                     logger.info("FanControl stopped successfully with -e")
                     
@@ -227,30 +604,24 @@ class FanController:
                 logger.warning("FanControl -e command timed out")
             except Exception as e:
                 logger.warning(f"Failed to stop FanControl with -e: {e}")
+            self._invalidate_proc_cache()
             
-            time.sleep(1.0)
-            
-            max_wait = 5
-            wait_count = 0
-            while self.is_running() and wait_count < max_wait:
-                time.sleep(0.5)
-                wait_count += 1
-            
-            if self.is_running():
+            if not self._wait_until(lambda: not self._poll_running(), timeout=3.5,
+                                    history=self._stop_latencies):
                 logger.warning("FanControl still running after -e command, forcing termination")
                 self.stop_fancontrol(force=True)
-                time.sleep(0.5)
+                self._wait_until(lambda: not self._poll_running(), timeout=0.5)
             
             logger.info(f"Starting FanControl with config: {config_path}")
             try:
                 args = [exe_path, '-m', '-c', config_path]
                 
-                subprocess.Popen(args, creationflags=subprocess.CREATE_NO_WINDOW)
+                _spawn_detached(args, subprocess.CREATE_NO_WINDOW)
+                self._invalidate_proc_cache()
                 logger.info(f"Launched FanControl with: {' '.join(args)}")
                 
-                time.sleep(1.5)
-                
-                if self.is_running():
+                if self._wait_until(self._poll_running, timeout=1.5,
+                                    history=self._start_latencies):
                     logger.info(f"Successfully switched to config: {os.path.basename(config_path)}")
                     return True
                 else:
@@ -275,6 +646,9 @@ class FanController:
     
     def refresh_sensors(self) -> bool:
         """Refresh FanControl sensors using -r command"""
+        if time.monotonic() - self._last_refresh < self.refresh_min_interval:
+            return True
+        
         try:
             if not self.ensure_running():
                 return False
@@ -283,16 +657,18 @@ class FanController:
             if exe_path:
                 try:
                     result = subprocess.run([exe_path, '-r'],
-                                          capture_output=True,
-                                          text=True,
+                                          stdout=subprocess.DEVNULL,
+                                          stderr=subprocess.PIPE,
                                           timeout=5,
                                           creationflags=subprocess.CREATE_NO_WINDOW)
                     
                     if result.returncode == 0:
                         logger.info("Sent sensor refresh command to FanControl")
+                        self._last_refresh = time.monotonic()
                         return True
                     else:
-                        logger.warning(f"Sensor refresh returned code {result.returncode}: {result.stderr}")
+                        stderr = result.stderr.decode('utf-8', errors='replace')
+                        logger.warning(f"Sensor refresh returned code {result.returncode}: {stderr}")
                         return False
                         
                 except subprocess.TimeoutExpired:
@@ -309,47 +685,98 @@ class FanController:
             logger.error(f"Error refreshing sensors: {e}")
             return False
     
-    def get_config_files(self) -> List[Dict[str, Any]]:
-        """Get list of available config files"""
-        if not self.fan_config_path or not os.path.exists(self.fan_config_path):
-            return []
+    def _config_table(self) -> _ConfigTable:
+        """Get the config listing columns, rescanning only when the directory changed"""
+        if not self.fan_config_path:
+            return _EMPTY_TABLE
         
+        # Adding, removing or renaming a config updates the directory's
+        # mtime, so an unchanged directory stat means the listing is current
         try:
-            configs = []
-            for filename in os.listdir(self.fan_config_path):
-                if filename.endswith('.json'):
-                    filepath = os.path.join(self.fan_config_path, filename)
-                    if os.path.isfile(filepath):
-                        config_name = os.path.splitext(filename)[0]
-                        
-                        percentage = None
-                        import re
-                        match = re.search(r'(\d{1,3})', config_name)
-                        if match:
-                            pct = int(match.group(1))
-                            if 0 <= pct <= 100:
-                                percentage = pct
-                        
-                        configs.append({
-                            "name": config_name,
-                            "filename": filename,
-                            "filepath": filepath,
-                            "percentage": percentage,
-                            "size": os.path.getsize(filepath),
-                            "modified": os.path.getmtime(filepath)
-                        })
-            
-            configs.sort(key=lambda x: (x["percentage"] is None, x["percentage"], x["name"]))
-            return configs
+            st = os.stat(self.fan_config_path)
+        except OSError:
+            return _EMPTY_TABLE
+        key = (self.fan_config_path, st.st_mtime_ns, st.st_size)
+        table = self._cfg_table
+        if key == table.key and time.monotonic() - table.scanned_at < _CONFIG_MAX_AGE:
+            return table
+        
+        try:
+            rows = []
+            # scandir supplies the file type and stat data with the listing
+            # instead of separate isfile/getsize/getmtime calls per file
+            with os.scandir(self.fan_config_path) as entries:
+                for entry in entries:
+                    filename = entry.name
+                    if not filename.endswith('.json') or not entry.is_file():
+                        continue
+                    config_name = filename[:-5]  # strip '.json'
+                    
+                    percentage = _NO_PCT
+                    match = _PCT_RE.search(config_name)
+                    if match:
+                        pct = int(match.group(1))
+                        if 0 <= pct <= 100:
+                            percentage = pct
+                    
+                    file_stat = entry.stat()
+                    rows.append((percentage, config_name, entry.path,
+                                 file_stat.st_size, file_stat.st_mtime))
+            
+            # Tuples sort natively by (percentage, name)
+            rows.sort()
+            pcts, names, paths, sizes, mtimes = zip(*rows) if rows else ((), (), (), (), ())
+            pcts = array('h', pcts)
+            table = _ConfigTable(key, list(names), list(paths), pcts,
+                                 array('q', sizes), array('d', mtimes),
+                                 bisect_left(pcts, _NO_PCT), time.monotonic())
+            self._cfg_table = table
+            return table
             
         except Exception as e:
             logger.error(f"Error reading config files: {e}")
-            return []
+            return _EMPTY_TABLE
+    
+    def get_config_files(self) -> List[Dict[str, Any]]:
+        """Get list of available config files"""
+        table = self._config_table()
+        view = self._cfg_view
+        # Keyed on the table itself, as a rescan may keep the same stat key
+        if view[0] is not table:
+            view = (table, [table.row(i) for i in range(len(table.names))])
+            self._cfg_view = view
+        return list(view[1])
+    
+    def _name_index(self, table: _ConfigTable) -> Dict[str, int]:
+        """Get config rows keyed by case-folded name, rebuilt with the listing"""
+        if self._names_index[0] != table.key:
+            index = {}
+            for i, name in enumerate(table.names):
+                # First config wins when names differ only by case
+                index.setdefault(name.casefold(), i)
+            self._names_index = (table.key, index)
+        return self._names_index[1]
+    
+    def _snapshot(self) -> Dict[str, Any]:
+        """Gather process, config and configuration state in one pass"""
+        return {
+            "processes": self.get_fancontrol_processes(),
+            "configs": self.get_config_files(),
+            "configured": self.is_configured()
+        }
+    
+    def count_configs(self) -> Tuple[int, int]:
+        """Get (total, with percentage) config counts without building the config dicts"""
+        table = self._config_table()
+        return len(table.names), table.n_pct
     
     def get_config_summary(self) -> Dict[str, Any]:
         """Get summary of available configs"""
-        configs = self.get_config_files()
-        
+        return self._summarize_configs(self.get_config_files())
+    
+    @staticmethod
+    def _summarize_configs(configs: List[Dict[str, Any]]) -> Dict[str, Any]:
+        """Build the config summary for an already listed set of configs"""
         with_percentage = [c for c in configs if c["percentage"] is not None]
         
         return {
@@ -364,70 +791,66 @@ class FanController:
         if not 0 <= percentage <= 100:
             raise ValueError("Percentage must be between 0 and 100")
         
-        configs = self.get_config_files()
-        percentage_configs = [c for c in configs if c["percentage"] is not None]
+        table = self._config_table()
+        pcts, n_pct = table.pcts, table.n_pct
         
-        if not percentage_configs:
+        if not n_pct:
             raise RuntimeError("No percentage-based configs found")
         
-        # Find exact match first
-        exact_match = next((c for c in percentage_configs if c["percentage"] == percentage), None)
-        if exact_match:
-            success = self.switch_config(exact_match["filepath"])
+        # Binary search the leading percentage rows; ties between the
+        # neighbours below and above go to the lower one, as min() did
+        idx = bisect_left(pcts, percentage, 0, n_pct)
+        if idx < n_pct and pcts[idx] == percentage:
+            success = self.switch_config(table.paths[idx])
             return {
                 "ok": success,
                 "requested": percentage,
                 "applied": percentage,
-                "config": exact_match["filepath"],
-                "config_name": exact_match["name"],
+                "config": table.paths[idx],
+                "config_name": table.names[idx],
                 "exact_match": True
             }
         
-        # Find closest match
-        closest = min(percentage_configs, key=lambda x: abs(x["percentage"] - percentage))
-        success = self.switch_config(closest["filepath"])
+        if idx == n_pct or (idx > 0 and percentage - pcts[idx - 1] <= pcts[idx] - percentage):
+            idx = bisect_left(pcts, pcts[idx - 1], 0, n_pct)
+        success = self.switch_config(table.paths[idx])
         
         return {
             "ok": success,
             "requested": percentage,
-            "applied": closest["percentage"],
-            "config": closest["filepath"],
-            "config_name": closest["name"],
+            "applied": pcts[idx],
+            "config": table.paths[idx],
+            "config_name": table.names[idx],
             "exact_match": False
         }
     
     def set_fan_profile(self, profile_name: str) -> Dict[str, Any]:
         """Set fan profile by name"""
-        configs = self.get_config_files()
-        
         # Find config by name (case insensitive)
-        matching_config = None
-        for config in configs:
-            if config["name"].lower() == profile_name.lower():
-                matching_config = config
-                break
+        table = self._config_table()
+        idx = self._name_index(table).get(profile_name.casefold())
         
-        if not matching_config:
-            available_names = [c["name"] for c in configs]
-            raise RuntimeError(f"Profile '{profile_name}' not found. Available: {available_names}")
+        if idx is None:
+            raise RuntimeError(f"Profile '{profile_name}' not found. Available: {table.names}")
         
-        success = self.switch_config(matching_config["filepath"])
+        success = self.switch_config(table.paths[idx])
         
         return {
             "ok": success,
             "profile": profile_name,
-            "config": matching_config["filepath"],
-            "config_name": matching_config["name"]
+            "config": table.paths[idx],
+            "config_name": table.names[idx]
         }
     
     def get_status(self) -> Dict[str, Any]:
         """Get fan control status"""
         try:
-            processes = self.get_fancontrol_processes()
+            snapshot = self._snapshot()
+            processes = snapshot["processes"]
             running = len(processes) > 0
             
             status = {
-                "configured": self.is_configured(),
+                "configured": snapshot["configured"],
                 "running": running,
                 "exe_path": self.fan_exe_path,
                 "config_path": self.fan_config_path,
@@ -444,9 +867,8 @@ class FanController:
                 except (psutil.NoSuchProcess, psutil.AccessDenied):
                     continue
             
-            if self.fan_config_path and os.path.exists(self.fan_config_path):
-                config_summary = self.get_config_summary()
-                status["configs"] = config_summary
+            if self._path_exists(self.fan_config_path):
+                status["configs"] = self._summarize_configs(snapshot["configs"])
             
             return status
             
@@ -461,18 +883,21 @@ class FanController:
     def test_fan_system(self) -> Dict[str, Any]:
         """Test fan control system"""
         try:
+            # Only counts and a yes/no are needed, so skip the process
+            # handles and config dicts entirely
+            running = self.is_running()
             test_results = {
-                "exe_exists": os.path.exists(self.fan_exe_path) if self.fan_exe_path else False,
-                "config_dir_exists": os.path.exists(self.fan_config_path) if self.fan_config_path else False,
-                "running": self.is_running(),
+                "exe_exists": self._path_exists(self.fan_exe_path),
+                "config_dir_exists": self._path_exists(self.fan_config_path),
+                "running": running,
                 "config_count": 0,
                 "percentage_config_count": 0
             }
             
             if test_results["config_dir_exists"]:
-                configs = self.get_config_files()
-                test_results["config_count"] = len(configs)
-                test_results["percentage_config_count"] = len([c for c in configs if c["percentage"] is not None])
+                total, with_percentage = self.count_configs()
+                test_results["config_count"] = total
+                test_results["percentage_config_count"] = with_percentage
             
             test_results["system_ready"] = (
                 test_results["exe_exists"] and 
@@ -10,18 +10,54 @@ Disclaimer: Provided AS IS. See README.md 'AS IS Disclaimer' for details.
 """
 
 import os
+import time
 import subprocess
 import logging
 from typing import Dict, Any, List, Optional
 
 logger = logging.getLogger(__name__)
 
+# Default Steam client locations, checked once per controller
+STEAM_EXE_PATHS = [
+    "C:\\Program Files (x86)\\Steam\\steam.exe",
+    "C:\\Program Files\\Steam\\steam.exe"
+]
+
+# Steam is rarely installed or removed, so detection is reused for 5 minutes
+_STEAM_CHECK_TTL = 300.0
+
+def _find_steam_exe() -> Optional[str]:
+    """Return the first existing steam.exe location, if any"""
+    for path in STEAM_EXE_PATHS:
+        if os.path.exists(path):
+            return path
+    return None
+
 class GamingController:
     """Controller for game launching functionality"""
     
     def __init__(self):
         """Initialize gaming controller"""
-        pass
+        # Launching steam.exe directly skips the ShellExecute/protocol handler
+        # lookup that steam:// URLs go through on every call
+        self._steam_exe = _find_steam_exe() if os.name == 'nt' else None
+        # (time checked, steam found) for test_gaming_system
+        self._steam_check = (float('-inf'), False)
+        
+        # (mappings list, its length, {case-folded label: mapping}); settings
+        # hands out the same list until the mappings are replaced, so the
+        # index is rebuilt only when the list object or its length changes
+        self._mapping_index = (None, 0, {})
+    
+    def _find_mapping(self, label: str, mappings: List[Dict[str, Any]]) -> Optional[Dict[str, Any]]:
+        """Find the first mapping whose label matches (case-insensitive)"""
+        source, length, index = self._mapping_index
+        if mappings is not source or len(mappings) != length:
+            index = {}
+            for m in mappings:
+                index.setdefault(m.get('label', '').strip().casefold(), m)
+            self._mapping_index = (mappings, len(mappings), index)
+        return index.get(label.strip().casefold())
     
     def launch_game_by_steam_id(self, steam_appid: str) -> Dict[str, Any]:
         """Launch a game by Steam App ID"""
@@ -32,7 +68,14 @@ class GamingController:
             steam_url = f"steam://run/{steam_appid}"
             
             if os.name == 'nt':
-                os.startfile(steam_url)
+                # Only numeric IDs go on the command line, so an ID can't
+                # smuggle extra steam.exe options in
+                if self._steam_exe and steam_appid.isdigit():
+                    subprocess.Popen([self._steam_exe, '-applaunch', steam_appid],
+                                     creationflags=subprocess.CREATE_NEW_PROCESS_GROUP,
+                                     close_fds=True)
+                else:
+                    os.startfile(steam_url)
             else:
                 subprocess.run(['xdg-open', steam_url], check=False)
             
@@ -87,11 +130,7 @@ class GamingController:
     def launch_game_by_label(self, label: str, mappings: List[Dict[str, Any]]) -> Dict[str, Any]:
         """Launch a game by label using mappings"""
         try:
-            mapping = None
-            for m in mappings:
-                if m.get('label', '').strip().lower() == label.strip().lower():
-                    mapping = m
-                    break
+            mapping = self._find_mapping(label, mappings)
             
             if not mapping:
                 return {
@@ -133,15 +172,29 @@ class GamingController:
         """Get the audio device that should be used for a specific game"""
         try:
             # Find the game mapping
-            for mapping in mappings:
-                if mapping.get('label', '').strip().lower() == label.strip().lower():
-                    if mapping.get('use_for_audio', False):
-                        return mapping.get('label')  # Return the game label
+            mapping = self._find_mapping(label, mappings)
+            if mapping and mapping.get('use_for_audio', False):
+                return mapping.get('label')  # Return the game label
             return None
         except Exception as e:
             logger.error(f"Failed to get audio device for game {label}: {e}")
             return None
     
+    def _steam_installed(self) -> bool:
+        """Check for a Steam install, reusing the answer for _STEAM_CHECK_TTL seconds"""
+        now = time.monotonic()
+        checked_at, found = self._steam_check
+        if now - checked_at < _STEAM_CHECK_TTL:
+            return found
+        
+        steam_paths = [
+            os.path.expanduser("~\\AppData\\Roaming\\Microsoft\\Windows\\Start Menu\\Programs\\Steam\\Steam.lnk"),
+            *STEAM_EXE_PATHS
+        ]
+        found = any(os.path.exists(steam_path) for steam_path in steam_paths)
+        self._steam_check = (now, found)
+        return found
+    
     def test_gaming_system(self) -> Dict[str, Any]:
         """Test gaming system functionality"""
         try:
@@ -152,16 +205,7 @@ class GamingController:
                 "issues": []
             }
             
-            steam_paths = [
-                os.path.expanduser("~\\AppData\\Roaming\\Microsoft\\Windows\\Start Menu\\Programs\\Steam\\Steam.lnk"),
-                "C:\\Program Files (x86)\\Steam\\steam.exe",
-                "C:\\Program Files\\Steam\\steam.exe"
-            ]
-            
-            for steam_path in steam_paths:
-                if os.path.exists(steam_path):
-                    result["steam_available"] = True
-                    break
+            result["steam_available"] = self._steam_installed()
             
             if not result["steam_available"]:
                 result["issues"].append("Steam installation not detected - Steam App ID launches may not work")
@@ -12,18 +12,17 @@ Disclaimer: Use at your own risk. See LICENSE for details.
 import os
 import sys
 import tempfile
+import functools
 import tkinter as tk  # Keep for some dialog compatibility
-from tkinter import messagebox, filedialog
-import tkinter.font as tkfont
+from tkinter import messagebox
 import customtkinter as ctk
 CTK_AVAILABLE = True
-import webbrowser
-import requests
-import json
 import logging
+# requests, json, webbrowser and filedialog are imported where they are used;
+# none is needed to show the window and requests alone is slow to import
 
 
-from src.utils import AutostartManager, validate_executable, open_file_location
+from src.utils import AutostartManager, validate_executable, open_file_location, get_app_data_dir
 from src.settings import SettingsManager
 from src.win_dpi_mixin import SmoothMoveMixin
 
@@ -41,6 +40,64 @@ def resource_path(*relative_parts):
     return os.path.join(base, *relative_parts)
 
 
+@functools.lru_cache(maxsize=256)
+def _shade_color_cached(hex_color: str, percent: float) -> str:
+    """Lighten (positive percent) or darken (negative percent) a hex color."""
+    try:
+        hex_color = hex_color.lstrip('#')
+        r = int(hex_color[0:2], 16)
+        g = int(hex_color[2:4], 16)
+        b = int(hex_color[4:6], 16)
+
+        def clamp(v):
+            return max(0, min(255, int(v)))
+
+        factor = 1.0 + (percent / 100.0)
+        r2 = clamp(r * factor)
+        g2 = clamp(g * factor)
+        b2 = clamp(b * factor)
+        return f"#{r2:02x}{g2:02x}{b2:02x}"
+    except Exception:
+        return hex_color
+
+
+def _cached_icon_file(src_path, size, fmt):
+    """Return a resized copy of an icon image cached under the app data dir.
+
+    Cache entries are keyed by the source file's content hash (a PyInstaller
+    onefile build re-extracts resources on every run, so mtimes are useless)
+    and created with Pillow only on a miss. Returns None if unavailable.
+    """
+    try:
+        import hashlib
+        with open(src_path, 'rb') as fh:
+            digest = hashlib.sha1(fh.read()).hexdigest()[:12]
+    except OSError:
+        return None
+
+    cache_dir = os.path.join(get_app_data_dir(), 'icons')
+    stem = os.path.splitext(os.path.basename(src_path))[0]
+    cached = os.path.join(cache_dir, f"{stem}_{size[0]}x{size[1]}_{digest}.{fmt}")
+    if os.path.exists(cached):
+        return cached
+
+    try:
+        from PIL import Image
+        os.makedirs(cache_dir, exist_ok=True)
+        tmp_path = cached + '.tmp'
+        with Image.open(src_path) as im:
+            im = im.convert('RGBA')
+            if fmt == 'ico':
+                im.save(tmp_path, format='ICO', sizes=[size])
+            else:
+                im.resize(size, Image.LANCZOS).save(tmp_path, format='PNG')
+        os.replace(tmp_path, cached)
+        return cached
+    except Exception as e:
+        logger.debug(f"Could not cache icon {src_path}: {e}")
+        return None
+
+
 class MainWindow(SmoothMoveMixin):
     # Class-level default palette (can be overridden per-instance)
     APP_BG = "#1E1F2B"
@@ -55,6 +112,16 @@ class MainWindow(SmoothMoveMixin):
     ACCENT_HOVER = "#A8C44A"
     DISABLED_BTN_BG = "#6b6b6b"
     DISABLED_BTN_FG = "#BFC7CF"
+    # Shared fonts for section titles, sub-titles, hints and field errors
+    TITLE_FONT = ("TkDefaultFont", 14, "bold")
+    SUBTITLE_FONT = ("TkDefaultFont", 12, "bold")
+    HINT_FONT = ("TkDefaultFont", 12)
+    ERR_FONT = ("TkDefaultFont", 8)
+    # Displayed icon sizes
+    APP_ICON_SIZE = (32, 32)
+    TRAY_ICON_SIZE = (64, 64)
+    # Start/stop report state changes directly; the timer is only a safety net
+    STATUS_HEARTBEAT_MS = 5000
 
     def __init__(self, root: tk.Tk, app):
         self.root = root
@@ -72,7 +139,10 @@ class MainWindow(SmoothMoveMixin):
         self._disabled_btn_bg = self.DISABLED_BTN_BG
         self._disabled_btn_fg = self.DISABLED_BTN_FG
         self._heavy_containers = []
+        self._flat_colors = {}
         self._status_timer_job = None
+        # Last server state drawn by update_server_status (None until first draw)
+        self._shown_server_running = None
         self._install_winmsg_hook()
         
         # GUI state variables
@@ -102,6 +172,8 @@ class MainWindow(SmoothMoveMixin):
         self.autostart_var = tk.BooleanVar()
         
         self._setup_window()
+        # Values go into the variables before any widget is bound to them
+        self._load_setting_vars()
         self._create_widgets()
         try:
             self._heavy_containers.extend([
@@ -110,11 +182,12 @@ class MainWindow(SmoothMoveMixin):
             ])
         except Exception:
             pass
-        self._load_settings()
-        self._setup_bindings()
+        # Settings widgets live in the initial tab, so filling them waits for it
+        self.root.after_idle(self._finish_startup)
         
-        # Start status update timer
-        self._status_timer_job = self.root.after(1000, self._update_status_timer)
+        # Draw the initial server status, then keep a heartbeat running
+        self.update_server_status()
+        self._status_timer_job = self.root.after(self.STATUS_HEARTBEAT_MS, self._update_status_timer)
 
     # override: do image/font swaps here (once per DPI)
     def _heavy_relayout(self, dpi):
@@ -147,6 +220,16 @@ class MainWindow(SmoothMoveMixin):
             kwargs['hover_color'] = hover_color
         return ctk.CTkButton(parent, text=text, command=command, **kwargs)
 
+    def _flat_button(self, parent, text, bg, fg, command=None):
+        """Native flat button; unlike CTkButton it has no canvas to repaint on hover"""
+        btn = tk.Button(parent, text=text, bg=bg, fg=fg, command=command,
+                        activebackground=self._shade_color(bg, 10), activeforeground=fg,
+                        disabledforeground=self._disabled_btn_fg,
+                        relief=tk.FLAT, bd=0, padx=12, pady=6, cursor='hand2')
+        # Enabled colors, restored by update_server_status after disabling
+        self._flat_colors[btn] = (bg, fg)
+        return btn
+
     def _entry(self, parent, textvariable=None, width=None, show=None):
         kwargs = {}
         if textvariable is not None:
@@ -167,6 +250,89 @@ class MainWindow(SmoothMoveMixin):
         self.root.minsize(600, 900)
         self._apply_steel_blue_theme()
 
+        # Icons are decoded and resized after the window first paints
+        self._app_icon = None
+        self._tray_icon_img = None
+        self.root.after_idle(self._load_icons_deferred)
+        
+        self.root.protocol("WM_DELETE_WINDOW", self._on_window_close)
+
+        # Window styles and WM_SETICON only stick once the window is mapped, so
+        # apply them from the Map event (which also fires on every re-show
+        # from the tray) instead of guessing with timers
+        try:
+            if os.name == 'nt':
+                self.root.bind('<Map>', self._on_root_map, add='+')
+        except Exception:
+            pass
+    
+    def _on_root_map(self, event):
+        """Reapply the taskbar icon whenever the main window is mapped"""
+        # Child widgets share the root's bindtag; only react to the window itself
+        if event.widget is self.root:
+            self._ensure_taskbar_icon()
+    
+    def _load_icons_deferred(self):
+        """Load window/tray icons once the window is up (scheduled by _setup_window)"""
+        try:
+            if not self.root.winfo_exists():
+                return
+        except Exception:
+            return
+        
+        if not self._load_cached_icons():
+            self._load_icons_uncached()
+
+        if os.name == 'nt':
+            self._ensure_taskbar_icon()
+    
+    @staticmethod
+    def _presized_icon(name, size):
+        """Path of a shipped icon already at `size` (e.g. name_32.png), or None"""
+        path = resource_path(f'{name}_{size[0]}.png')
+        return path if os.path.exists(path) else None
+
+    def _load_cached_icons(self):
+        """Load icons from pre-sized or cached files; False if they are unavailable"""
+        icon_path = resource_path('mylocalapiappicon.png')
+        tray_path = resource_path('systemtrayicon.png')
+        app_ico_path = resource_path('MyLocalAPI_app_icon_new.ico')
+        self._app_ico_path = app_ico_path
+        self._tray_ico_path = resource_path('MyLocalAPI_tray_icon_new.ico')
+
+        app_png = self._presized_icon('mylocalapiappicon', self.APP_ICON_SIZE) \
+            or _cached_icon_file(icon_path, self.APP_ICON_SIZE, 'png')
+        tray_png = self._presized_icon('systemtrayicon', self.TRAY_ICON_SIZE) \
+            or _cached_icon_file(tray_path, self.TRAY_ICON_SIZE, 'png')
+        if not app_png or not tray_png:
+            return False
+        try:
+            # Tk reads PNG itself, so warm starts need no Pillow at all
+            self._app_icon = tk.PhotoImage(file=app_png)
+            self._tray_icon_img = tk.PhotoImage(file=tray_png)
+        except Exception as e:
+            logger.debug(f"Could not load cached icons: {e}")
+            return False
+        try:
+            self.root.iconphoto(True, self._app_icon)
+        except Exception:
+            pass
+
+        if os.name == 'nt':
+            if os.path.exists(app_ico_path):
+                ico_path = app_ico_path
+            else:
+                ico_path = _cached_icon_file(icon_path, self.APP_ICON_SIZE, 'ico')
+            if ico_path:
+                try:
+                    self.root.iconbitmap(ico_path)
+                    self._temp_icon_ico = ico_path
+                except Exception:
+                    pass
+        return True
+    
+    def _load_icons_uncached(self):
+        """Decode and resize the icons directly (fallback when the cache can't be used)"""
         # Load icons (keep references on self to avoid GC) and ensure they're small
         try:
             icon_path = resource_path('mylocalapiappicon.png')
@@ -178,8 +344,8 @@ class MainWindow(SmoothMoveMixin):
             self._tray_ico_path = tray_ico_path
 
             # Desired display sizes (increased app icon size)
-            APP_ICON_SIZE = (32, 32)
-            TRAY_ICON_SIZE = (64, 64)
+            APP_ICON_SIZE = self.APP_ICON_SIZE
+            TRAY_ICON_SIZE = self.TRAY_ICON_SIZE
 
             try:
                 from PIL import Image, ImageTk
@@ -268,20 +434,6 @@ class MainWindow(SmoothMoveMixin):
                     pass
         except Exception as e:
             logger.debug(f"Could not load icons: {e}")
-        
-        self.root.protocol("WM_DELETE_WINDOW", self._on_window_close)
-
-        # Schedule a deferred ensure of taskbar icon on Windows. Some backends
-        # require the window to be mapped before window styles and WM_SETICON can be applied.
-        try:
-            if os.name == 'nt':
-                self.root.after(100, lambda: self._ensure_taskbar_icon())
-                try:
-                    self.root.after(500, lambda: self._ensure_taskbar_icon())
-                except Exception:
-                    pass
-        except Exception:
-            pass
     
     def _apply_steel_blue_theme(self):
         """Apply a steel-blue dark theme to the Tkinter/ttk UI"""
@@ -290,10 +442,6 @@ class MainWindow(SmoothMoveMixin):
             if CTK_AVAILABLE:
                 try:
                     ctk.set_appearance_mode('dark')
-                    try:
-                        ctk.set_default_color_theme('dark-blue')
-                    except Exception:
-                        pass
                 except Exception:
                     pass
 
@@ -358,6 +506,10 @@ class MainWindow(SmoothMoveMixin):
                         if not theme_found:
                             # Fallback to programmatic theme object
                             logger.debug('CTk theme file not found; using fallback color mapping')
+                            try:
+                                ctk.set_default_color_theme('dark-blue')
+                            except Exception:
+                                pass
                             theme_obj = {
                                 'color_primary': accent,
                                 'color_secondary': alt_bg,
@@ -384,8 +536,8 @@ class MainWindow(SmoothMoveMixin):
     def _ensure_taskbar_icon(self):
         """Ensure the window shows a proper taskbar icon on Windows.
 
-        This is separated so callers (for example `show_main_window`) can
-        reapply styles and WM_SETICON after the window is mapped.
+        Called from the root's <Map> handler so styles and WM_SETICON are
+        reapplied each time the window is mapped.
         """
         if os.name != 'nt':
             return
@@ -397,22 +549,8 @@ class MainWindow(SmoothMoveMixin):
 
     def _shade_color(self, hex_color: str, percent: float) -> str:
         """Lighten (positive percent) or darken (negative percent) a hex color."""
-        try:
-            hex_color = hex_color.lstrip('#')
-            r = int(hex_color[0:2], 16)
-            g = int(hex_color[2:4], 16)
-            b = int(hex_color[4:6], 16)
-
-            def clamp(v):
-                return max(0, min(255, int(v)))
-
-            factor = 1.0 + (percent / 100.0)
-            r2 = clamp(r * factor)
-            g2 = clamp(g * factor)
-            b2 = clamp(b * factor)
-            return f"#{r2:02x}{g2:02x}{b2:02x}"
-        except Exception:
-            return hex_color
+        # Hover and card code asks for the same few shades over and over
+        return _shade_color_cached(hex_color, percent)
    
     def _create_widgets(self):
         """Create all GUI widgets"""
@@ -441,11 +579,10 @@ class MainWindow(SmoothMoveMixin):
         button_frame = ctk.CTkFrame(status_frame)
         button_frame.pack(fill=tk.X, padx=10, pady=(0, 10))
 
-        self.start_button = ctk.CTkButton(button_frame, text="▶ Start", fg_color=getattr(self, '_success', '#BBD760'), text_color=getattr(self, '_app_bg', '#1E1F2B'), width=100, command=self._start_server)
-            
-        self.stop_button = ctk.CTkButton(button_frame, text="■ Stop", fg_color=getattr(self, '_danger', '#FC6A6A'), text_color=getattr(self, '_fg', '#E6EEF3'), width=100, command=self._stop_server)
-        self.restart_button = ctk.CTkButton(button_frame, text="↻ Restart", text_color=getattr(self, '_fg', '#E6EEF3'), width=100, command=self._restart_server)
-        ctk.CTkButton(button_frame, text="Open Browser", command=self._open_browser).pack(side=tk.RIGHT)
+        self.start_button = self._flat_button(button_frame, "▶ Start", self._success, self._app_bg, command=self._start_server)
+        self.stop_button = self._flat_button(button_frame, "■ Stop", self._danger, self._fg, command=self._stop_server)
+        self.restart_button = self._flat_button(button_frame, "↻ Restart", self._input_bg, self._fg, command=self._restart_server)
+        self._flat_button(button_frame, "Open Browser", self._input_bg, self._fg, command=self._open_browser).pack(side=tk.RIGHT)
 
         self.start_button.pack(side=tk.LEFT, padx=(0, 5))
         self.stop_button.pack(side=tk.LEFT, padx=(0, 5))
@@ -465,7 +602,7 @@ class MainWindow(SmoothMoveMixin):
         port_entry.pack(side=tk.LEFT, padx=(5, 8))
 
         # Error label for port (hidden until needed)
-        self.port_error_label = ctk.CTkLabel(port_frame, text="", text_color=self._danger, font=("TkDefaultFont", 8))
+        self.port_error_label = ctk.CTkLabel(port_frame, text="", text_color=self._danger, font=self.ERR_FONT)
         # Place error label below the entry; make it span the full width
         self.port_error_label.pack(fill=tk.X, padx=(5, 8))
 
@@ -483,7 +620,7 @@ class MainWindow(SmoothMoveMixin):
         token_entry.pack(side=tk.LEFT, padx=(5, 8), fill=tk.X, expand=True)
 
         # Error label for token (hidden until needed)
-        self.token_error_label = ctk.CTkLabel(token_frame, text="", text_color=self._danger, font=("TkDefaultFont", 8))
+        self.token_error_label = ctk.CTkLabel(token_frame, text="", text_color=self._danger, font=self.ERR_FONT)
         self.token_error_label.pack(fill=tk.X, padx=(5, 8))
 
         # Keep references for validation
@@ -492,7 +629,7 @@ class MainWindow(SmoothMoveMixin):
     
     def _create_tabbed_interface(self, parent):
         """Create tabbed interface"""
-        self.notebook = ctk.CTkTabview(parent)
+        self.notebook = ctk.CTkTabview(parent, command=self._on_tab_selected)
         self.notebook.pack(fill=tk.BOTH, expand=True)
 
         self.notebook.add("Settings")
@@ -503,16 +640,54 @@ class MainWindow(SmoothMoveMixin):
         self.endpoints_frame = self.notebook.tab("Endpoints")
         self.logs_frame = self.notebook.tab("Logs")
 
-        self._create_settings_tab()
-        self._create_endpoints_tab()
-        self._create_logs_tab()
+        # Tab contents are built on first selection; status updates before
+        # then see an empty endpoint list
+        self.endpoint_widgets = []
+        self._tab_builders = {
+            "Settings": self._create_settings_tab,
+            "Endpoints": self._create_endpoints_tab,
+            "Logs": self._create_logs_tab,
+        }
+        self._tab_built = set()
+
+    def _ensure_tab_built(self, name: str) -> bool:
+        """Build a tab's contents if they have not been built yet"""
+        if name in self._tab_built or name not in self._tab_builders:
+            return False
+        self._tab_built.add(name)
+        self._tab_builders[name]()
+        if name == "Endpoints":
+            self._update_endpoints_status()
+        return True
+
+    def _on_tab_selected(self):
+        """Build the newly selected tab on first visit"""
+        try:
+            self._ensure_tab_built(self.notebook.get())
+        except Exception as e:
+            logger.error(f"Error building tab: {e}")
+
+    def _finish_startup(self):
+        """Build the initial tab and load settings once the window has painted"""
+        try:
+            if not self.root.winfo_exists():
+                return
+        except Exception:
+            return
+        self._ensure_tab_built(self.notebook.get())
+        self._apply_loaded_settings()
+        self._setup_bindings()
 
     def _attach_mousewheel(self, canvas: tk.Canvas, widget: tk.Widget):
         """Attach cross-platform mousewheel scrolling when pointer is over widget/canvas.
 
-        On <Enter> we bind global mousewheel events so scrolling works without focus.
-        On <Leave> we unbind them to avoid interfering with other widgets.
+        The handlers are bound to a bindtag carried by the canvas and all of
+        its descendants, so no global bindings change as the pointer moves.
+        Rows added later are tagged by their builders via `_tag_for_wheel`.
         """
+        tag = f'wheel{id(canvas)}'
+        self._wheel_tag = tag
+
         def _on_mousewheel(event):
             # Linux (Button-4/5)
             if getattr(event, 'num', None) == 4:
@@ -528,39 +703,48 @@ class MainWindow(SmoothMoveMixin):
                         step = 1 if delta > 0 else -1
                     canvas.yview_scroll(-step, 'units')
 
-        def _bind_all(e=None):
-            widget.bind_all('<MouseWheel>', _on_mousewheel)
-            widget.bind_all('<Button-4>', _on_mousewheel)
-            widget.bind_all('<Button-5>', _on_mousewheel)
-
-        def _unbind_all(e=None):
-            try:
-                widget.unbind_all('<MouseWheel>')
-                widget.unbind_all('<Button-4>')
-                widget.unbind_all('<Button-5>')
-            except Exception:
-                pass
-
-        # Bind enter/leave on both the canvas and the inner widget so hovering anywhere works
         try:
-            widget.bind('<Enter>', _bind_all)
-            widget.bind('<Leave>', _unbind_all)
-            canvas.bind('<Enter>', _bind_all)
-            canvas.bind('<Leave>', _unbind_all)
+            canvas.bind_class(tag, '<MouseWheel>', _on_mousewheel)
+            canvas.bind_class(tag, '<Button-4>', _on_mousewheel)
+            canvas.bind_class(tag, '<Button-5>', _on_mousewheel)
+            self._tag_for_wheel(canvas)
+            self._tag_for_wheel(widget)
         except Exception:
             pass
+
+    def _tag_for_wheel(self, w):
+        """Give `w` and its descendants the settings mousewheel bindtag."""
+        tag = getattr(self, '_wheel_tag', None)
+        if not tag:
+            return
+        tags = w.bindtags()
+        if tag not in tags:
+            w.bindtags((tag,) + tags)
+        for child in w.winfo_children():
+            self._tag_for_wheel(child)
     
     def _create_settings_tab(self):
         """Create settings tab content"""
-        # Create a CTkScrollableFrame for the settings tab
-        scrollable = ctk.CTkScrollableFrame(self.settings_frame)
-        scrollable.pack(fill=tk.BOTH, expand=True, pady=(0, 10))
+        # Scroll the sections with a plain Tk canvas; CTkScrollableFrame
+        # redraws its own canvas widgets on every scroll and resize
+        canvas = tk.Canvas(self.settings_frame, bg=self._app_bg, highlightthickness=0, bd=0)
+        vsb = tk.Scrollbar(self.settings_frame, orient=tk.VERTICAL, command=canvas.yview)
+        canvas.configure(yscrollcommand=vsb.set)
+        vsb.pack(side=tk.RIGHT, fill=tk.Y, pady=(0, 10))
+        canvas.pack(side=tk.LEFT, fill=tk.BOTH, expand=True, pady=(0, 10))
+
+        scrollable = tk.Frame(canvas, bg=self._app_bg)
+        window_id = canvas.create_window((0, 0), window=scrollable, anchor=tk.NW)
+        scrollable.bind('<Configure>', lambda e: canvas.configure(scrollregion=canvas.bbox('all')))
+        # Keep the sections as wide as the visible area
+        canvas.bind('<Configure>', lambda e: canvas.itemconfigure(window_id, width=e.width))
 
         self._create_audio_section(scrollable)
         self._create_fan_section(scrollable)
         self._create_streaming_section(scrollable)
         self._create_gaming_section(scrollable)
         self._create_system_section(scrollable)
+        self._attach_mousewheel(canvas, scrollable)
     
     def _create_audio_section(self, parent):
         """Create audio control section"""
@@ -571,8 +755,7 @@ class MainWindow(SmoothMoveMixin):
         self.audio_frame = audio_frame
 
         # Section title (larger and underlined)
-        title_font = ("TkDefaultFont", 14, "bold")
-        ctk.CTkLabel(audio_frame, text="Audio", font=title_font, text_color=self._fg).pack(anchor=tk.W, padx=10, pady=(8, 2))
+        ctk.CTkLabel(audio_frame, text="Audio", font=self.TITLE_FONT, text_color=self._fg).pack(anchor=tk.W, padx=10, pady=(8, 2))
         sep = ctk.CTkFrame(audio_frame, fg_color=self._shade_color(self._input_bg, -10), height=2)
         sep.pack(fill=tk.X, padx=10, pady=(0, 8))
 
@@ -600,7 +783,7 @@ class MainWindow(SmoothMoveMixin):
         self.svv_entry.pack(side=tk.LEFT, fill=tk.X, expand=True, padx=(10, 5))
         self._button(path_frame, text="Browse", command=self._browse_svv_path).pack(side=tk.RIGHT, padx=(0,5), pady=(0,5))
 
-        self._label(svv_frame, text="Optional: svcl.exe/SoundVolumeView will be bundled; only fill this to use a local installation.", text_color="gray", font=("TkDefaultFont", 12)).pack(anchor=tk.W, padx=(12,0),pady=(2, 0))
+        self._label(svv_frame, text="Optional: svcl.exe/SoundVolumeView will be bundled; only fill this to use a local installation.", text_color="gray", font=self.HINT_FONT).pack(anchor=tk.W, padx=(12,0),pady=(2, 0))
 
         # Device mappings - put into a card with rounded corners and slightly darker background
         card_bg = self._shade_color(self._input_bg, -6)
@@ -610,7 +793,7 @@ class MainWindow(SmoothMoveMixin):
         self.audio_mapping_card = mapping_card
 
         # Title for the device mapping card (larger title)
-        ctk.CTkLabel(mapping_card, text="Device Mappings", font=("TkDefaultFont", 12, "bold"), text_color=self._fg).pack(anchor=tk.W, padx=10, pady=(8, 2))
+        ctk.CTkLabel(mapping_card, text="Device Mappings", font=self.SUBTITLE_FONT, text_color=self._fg).pack(anchor=tk.W, padx=10, pady=(8, 2))
 
         # Mappings table (single grid so headers align with inputs/dropdowns)
         self.mappings_table = self._frame(mapping_card)
@@ -636,7 +819,7 @@ class MainWindow(SmoothMoveMixin):
         fan_frame.pack(fill=tk.X, padx=10, pady=8)
 
         # Section title (larger and underlined)
-        ctk.CTkLabel(fan_frame, text="Fan Control", font=("TkDefaultFont", 14, "bold"), text_color=self._fg).pack(anchor=tk.W, padx=10, pady=(8, 2))
+        ctk.CTkLabel(fan_frame, text="Fan Control", font=self.TITLE_FONT, text_color=self._fg).pack(anchor=tk.W, padx=10, pady=(8, 2))
         sep = ctk.CTkFrame(fan_frame, fg_color=self._shade_color(self._input_bg, -10), height=2)
         sep.pack(fill=tk.X, padx=10, pady=(0, 8))
 
@@ -760,7 +943,7 @@ class MainWindow(SmoothMoveMixin):
         """Create streaming section"""
         streaming_frame = ctk.CTkFrame(parent, fg_color=self._shade_color(self._app_bg, 6), corner_radius=6)
         streaming_frame.pack(fill=tk.X, padx=10, pady=8)
-        ctk.CTkLabel(streaming_frame, text="Streaming", font=("TkDefaultFont", 14, "bold"), text_color=self._fg).pack(anchor=tk.W, padx=10, pady=(8, 2))
+        ctk.CTkLabel(streaming_frame, text="Streaming", font=self.TITLE_FONT, text_color=self._fg).pack(anchor=tk.W, padx=10, pady=(8, 2))
         sep = ctk.CTkFrame(streaming_frame, fg_color=self._shade_color(self._input_bg, -10), height=2)
         sep.pack(fill=tk.X, padx=10, pady=(0, 8))
         ctk.CTkSwitch(streaming_frame, text="Launch streaming service by endpoint", variable=self.streaming_enabled_var, command=self._on_streaming_enabled_changed).pack(anchor=tk.W, padx=10, pady=5)
@@ -784,8 +967,7 @@ class MainWindow(SmoothMoveMixin):
         self.gaming_frame = gaming_frame
 
         # Section title (larger and underlined)
-        title_font = ("TkDefaultFont", 14, "bold")
-        ctk.CTkLabel(gaming_frame, text="Gaming", font=title_font, text_color=self._fg).pack(anchor=tk.W, padx=10, pady=(8, 2))
+        ctk.CTkLabel(gaming_frame, text="Gaming", font=self.TITLE_FONT, text_color=self._fg).pack(anchor=tk.W, padx=10, pady=(8, 2))
         sep = ctk.CTkFrame(gaming_frame, fg_color=self._shade_color(self._input_bg, -10), height=2)
         sep.pack(fill=tk.X, padx=10, pady=(0, 8))
 
@@ -800,7 +982,7 @@ class MainWindow(SmoothMoveMixin):
         self.gaming_mapping_card = gaming_mapping_card
 
         # Title for the game mapping card (larger title)
-        ctk.CTkLabel(gaming_mapping_card, text="Game Mappings", font=("TkDefaultFont", 12, "bold"), text_color=self._fg).pack(anchor=tk.W, padx=10, pady=(8, 2))
+        ctk.CTkLabel(gaming_mapping_card, text="Game Mappings", font=self.SUBTITLE_FONT, text_color=self._fg).pack(anchor=tk.W, padx=10, pady=(8, 2))
 
         # Gaming mappings table (single grid so headers align with inputs/dropdowns)
         self.gaming_mappings_table = self._frame(gaming_mapping_card)
@@ -821,7 +1003,7 @@ class MainWindow(SmoothMoveMixin):
         # System section card
         system_frame = ctk.CTkFrame(parent, fg_color=self._shade_color(self._app_bg, 6), corner_radius=6)
         system_frame.pack(fill=tk.X, padx=10, pady=8)
-        ctk.CTkLabel(system_frame, text="System", font=("TkDefaultFont", 14, "bold"), text_color=self._fg).pack(anchor=tk.W, padx=10, pady=(8, 2))
+        ctk.CTkLabel(system_frame, text="System", font=self.TITLE_FONT, text_color=self._fg).pack(anchor=tk.W, padx=10, pady=(8, 2))
         sep = ctk.CTkFrame(system_frame, fg_color=self._shade_color(self._input_bg, -10), height=2)
         sep.pack(fill=tk.X, padx=10, pady=(0, 8))
 
@@ -838,6 +1020,8 @@ class MainWindow(SmoothMoveMixin):
         ctk.CTkButton(settings_frame, text="Import Settings", command=self._import_settings).pack(side=tk.LEFT)
     
     def _create_endpoints_tab(self):
+        import json
+        
         self.endpoints_result_text = ctk.CTkTextbox(self.endpoints_frame, width=1, height=120)
         endpoints_container = ctk.CTkScrollableFrame(self.endpoints_frame)
         endpoints_container.pack(fill=tk.BOTH, expand=True)
@@ -870,14 +1054,13 @@ class MainWindow(SmoothMoveMixin):
             group_frame.pack(fill=tk.X, padx=5, pady=(14, 10))
 
             # Group title with status indicator on the left: larger, bold and underlined
-            title_font = ("TkDefaultFont", 12, "bold")
             title_row = ctk.CTkFrame(group_frame)
             title_row.pack(fill=tk.X, padx=10, pady=(6, 2))
 
             # Status dot to the left of the title
-            status_indicator = ctk.CTkLabel(title_row, text="●", font=("TkDefaultFont", 14, "bold"), text_color=getattr(self, '_success', '#BBD760'))
+            status_indicator = ctk.CTkLabel(title_row, text="●", font=self.TITLE_FONT, text_color=getattr(self, '_success', '#BBD760'))
             status_indicator.pack(side=tk.LEFT, padx=(10, 8))
-            ctk.CTkLabel(title_row, text=group_info.get("group", ""), font=title_font, text_color=self._fg).pack(side=tk.LEFT, anchor='w')
+            ctk.CTkLabel(title_row, text=group_info.get("group", ""), font=self.SUBTITLE_FONT, text_color=self._fg).pack(side=tk.LEFT, anchor='w')
             sep = ctk.CTkFrame(group_frame, fg_color=self._shade_color(self._input_bg, -10), height=2)
             sep.pack(fill=tk.X, padx=10, pady=(0, 8))
 
@@ -913,11 +1096,11 @@ class MainWindow(SmoothMoveMixin):
                 title_row = ctk.CTkFrame(info_frame)
                 title_row.pack(anchor=tk.W, fill=tk.X)
 
-                ind = ctk.CTkLabel(title_row, text="●", font=("TkDefaultFont", 14, "bold"), text_color=dot_color)
+                ind = ctk.CTkLabel(title_row, text="●", font=self.TITLE_FONT, text_color=dot_color)
                 ind.pack(side=tk.LEFT, padx=(12, 8))
 
-                ctk.CTkLabel(title_row, text=f"{endpoint['method']} {endpoint['path']}", font=("TkDefaultFont", 12, "bold"), text_color=self._fg).pack(side=tk.LEFT)
-                ctk.CTkLabel(info_frame, text=endpoint["description"], text_color="gray", font=("TkDefaultFont", 12)).pack(anchor=tk.W, padx=(5, 0))
+                ctk.CTkLabel(title_row, text=f"{endpoint['method']} {endpoint['path']}", font=self.SUBTITLE_FONT, text_color=self._fg).pack(side=tk.LEFT)
+                ctk.CTkLabel(info_frame, text=endpoint["description"], text_color="gray", font=self.HINT_FONT).pack(anchor=tk.W, padx=(5, 0))
                 if endpoint["params"]:
                     ctk.CTkLabel(info_frame, text=f"Parameters: {endpoint['params']}", font=("TkDefaultFont", 11), text_color=self._muted).pack(anchor=tk.W, padx=(5, 0))
 
@@ -995,15 +1178,56 @@ class MainWindow(SmoothMoveMixin):
     def _setup_bindings(self):
         """Setup event bindings"""
         # Settings change handlers
-        self.port_var.trace_add("write", self._on_port_changed)
-        self.token_var.trace_add("write", self._on_token_changed)
-        self.svv_path_var.trace_add("write", self._on_svv_path_changed)
-        self.fan_exe_var.trace_add("write", self._on_fan_exe_changed)
-        self.fan_config_var.trace_add("write", self._on_fan_config_changed)
-        self.apple_tv_moniker_var.trace_add("write", self._on_apple_tv_moniker_changed)
+        self._var_handlers = [
+            (self.port_var, self._on_port_changed),
+            (self.token_var, self._on_token_changed),
+            (self.svv_path_var, self._on_svv_path_changed),
+            (self.fan_exe_var, self._on_fan_exe_changed),
+            (self.fan_config_var, self._on_fan_config_changed),
+            (self.apple_tv_moniker_var, self._on_apple_tv_moniker_changed),
+        ]
+        self._add_var_traces()
+
+    def _add_var_traces(self):
+        self._var_traces = [(var, var.trace_add("write", handler)) for var, handler in self._var_handlers]
+
+    def _remove_var_traces(self):
+        for var, trace_id in getattr(self, '_var_traces', []):
+            try:
+                var.trace_remove("write", trace_id)
+            except Exception:
+                pass
+        self._var_traces = []
     
     def _load_settings(self):
         """Load settings into GUI"""
+        # The values come from the settings manager, so the change handlers
+        # that write them back are muted for the bulk load
+        traced = bool(getattr(self, '_var_traces', None))
+        self._remove_var_traces()
+        try:
+            self._load_setting_vars()
+        finally:
+            if traced:
+                self._add_var_traces()
+        if traced:
+            # What the muted handlers would have done besides saving
+            for entry, label in ((self.port_entry, self.port_error_label),
+                                 (self.token_entry, self.token_error_label)):
+                try:
+                    self._clear_field_error(entry, label)
+                except Exception:
+                    pass
+            if self.app.tray_icon:
+                self.app.update_tray_menu()
+        self._apply_loaded_settings()
+
+    def _load_setting_vars(self):
+        """Load settings into the Tk variables
+
+        Touches no widgets, so it can run before they exist; widgets created
+        afterwards pick the values up without a write event each.
+        """
         # Connection settings
         self.port_var.set(str(self.settings_manager.get_setting('port', 1482)))
         self.token_var.set(self.settings_manager.get_setting('token', 'changeme'))
@@ -1024,11 +1248,6 @@ class MainWindow(SmoothMoveMixin):
             self.fan_apply_game_var.set(self.settings_manager.get_setting('fan.apply_on_game_launch', False))
         except Exception:
             self.fan_apply_game_var.set(False)
-        # Refresh fan configs into dropdowns so selected_config values are visible
-        try:
-            self._refresh_fan_configs()
-        except Exception:
-            pass
         
         # Streaming settings
         self.streaming_enabled_var.set(self.settings_manager.get_setting('streaming.launch_streaming_by_endpoint', True))
@@ -1039,6 +1258,14 @@ class MainWindow(SmoothMoveMixin):
         
         # System settings
         self.autostart_var.set(AutostartManager.is_enabled())
+
+    def _apply_loaded_settings(self):
+        """Populate settings widgets from the loaded settings"""
+        # Refresh fan configs into dropdowns so selected_config values are visible
+        try:
+            self._refresh_fan_configs()
+        except Exception:
+            pass
         
         # Load device mappings
         self._load_device_mappings()
@@ -1237,6 +1464,8 @@ class MainWindow(SmoothMoveMixin):
         except Exception:
             pass
 
+        for w in row_data["widgets"]:
+            self._tag_for_wheel(w)
         self.mapping_rows.append(row_data)
 
         return row_data
@@ -1263,8 +1492,8 @@ class MainWindow(SmoothMoveMixin):
         delete_btn.grid(row=row_index, column=3, padx=(5, 5), pady=3)
 
         # Create error labels for Steam App ID and exe path
-        steam_appid_error = ctk.CTkLabel(row_parent, text="", text_color=self._danger, font=("TkDefaultFont", 8))
-        exe_path_error = ctk.CTkLabel(row_parent, text="", text_color=self._danger, font=("TkDefaultFont", 8))
+        steam_appid_error = ctk.CTkLabel(row_parent, text="", text_color=self._danger, font=self.ERR_FONT)
+        exe_path_error = ctk.CTkLabel(row_parent, text="", text_color=self._danger, font=self.ERR_FONT)
 
         # Position error labels beneath their respective fields (use next row)
         error_row = row_index + 1
@@ -1296,6 +1525,8 @@ class MainWindow(SmoothMoveMixin):
         except Exception:
             pass
 
+        for w in row_data["widgets"]:
+            self._tag_for_wheel(w)
         self.gaming_mapping_rows.append(row_data)
 
         return row_data
@@ -1866,6 +2097,7 @@ class MainWindow(SmoothMoveMixin):
     
     def _open_browser(self):
         """Open server URL in browser"""
+        import webbrowser
         port = self.settings_manager.get_setting('port', 1482)
         webbrowser.open(f'http://localhost:{port}/')
     
@@ -1915,6 +2147,7 @@ class MainWindow(SmoothMoveMixin):
     
     def _browse_svv_path(self):
         """Browse for SVV executable"""
+        from tkinter import filedialog
         filename = filedialog.askopenfilename(
             title="Select SoundVolumeView/svcl.exe",
             filetypes=[("Executable files", "*.exe"), ("All files", "*.*")]
@@ -1924,6 +2157,7 @@ class MainWindow(SmoothMoveMixin):
     
     def _browse_fan_exe(self):
         """Browse for FanControl executable"""
+        from tkinter import filedialog
         filename = filedialog.askopenfilename(
             title="Select FanControl.exe",
             filetypes=[("Executable files", "*.exe"), ("All files", "*.*")]
@@ -1933,6 +2167,7 @@ class MainWindow(SmoothMoveMixin):
     
     def _browse_fan_config(self):
         """Browse for fan config directory"""
+        from tkinter import filedialog
         dirname = filedialog.askdirectory(
             title="Select Fan Configuration Directory"
         )
@@ -2048,6 +2283,7 @@ class MainWindow(SmoothMoveMixin):
     
     def _export_settings(self):
         """Export settings to file"""
+        from tkinter import filedialog
         filename = filedialog.asksaveasfilename(
             title="Export Settings",
             defaultextension=".json",
@@ -2062,6 +2298,7 @@ class MainWindow(SmoothMoveMixin):
     
     def _import_settings(self):
         """Import settings from file"""
+        from tkinter import filedialog
         filename = filedialog.askopenfilename(
             title="Import Settings",
             filetypes=[("JSON files", "*.json"), ("All files", "*.*")]
@@ -2103,6 +2340,8 @@ class MainWindow(SmoothMoveMixin):
                         params[key] = value
             
             # Make request
+            import requests
+            import json
             url = base_url + endpoint_info["path"]
             response = requests.get(url, params=params, timeout=10)
             
@@ -2327,6 +2566,13 @@ class MainWindow(SmoothMoveMixin):
         def _set_button_enabled(btn, enabled, ctk_fg=None, ctk_text=None):
             state = "normal" if enabled else "disabled"
             btn.configure(state=state)
+            if btn in self._flat_colors:
+                # Flat Tk buttons grey their text natively via disabledforeground
+                bg, fg = self._flat_colors[btn]
+                if not enabled:
+                    bg = getattr(self, '_disabled_btn_bg', '#6b6b6b')
+                btn.configure(bg=bg, fg=fg)
+                return
             if enabled:
                 if ctk_fg is not None:
                     btn.configure(fg_color=ctk_fg)
@@ -2349,7 +2595,12 @@ class MainWindow(SmoothMoveMixin):
             except Exception:
                 pass
 
-        if self.app.is_server_running():
+        running = bool(self.app.is_server_running())
+        if running == self._shown_server_running:
+            return
+        self._shown_server_running = running
+
+        if running:
             self.server_status_var.set("Running")
             _set_widget_text_color(self.status_label, "green")
 
@@ -2368,11 +2619,18 @@ class MainWindow(SmoothMoveMixin):
 
             # bottom buttons removed; nothing to update on the bottom side
     
+    def on_server_state_changed(self):
+        """Redraw the server status on the UI thread after a start/stop"""
+        try:
+            self.root.after(0, self.update_server_status)
+        except Exception:
+            pass
+
     def _update_status_timer(self):
-        """Timer callback to update status"""
+        """Heartbeat that catches server state changes nobody reported"""
         self.update_server_status()
-        # Schedule next update
-        self.root.after(2000, self._update_status_timer)
+        # Schedule next check
+        self._status_timer_job = self.root.after(self.STATUS_HEARTBEAT_MS, self._update_status_timer)
     
     def _on_window_close(self):
         """Handle window close - minimize to tray instead of quit"""
@@ -219,8 +219,8 @@ class MyLocalAPIApp:
             if CTK_AVAILABLE:
                 root = ctk.CTk()
                 try:
+                    # MainWindow loads the color theme itself
                     ctk.set_appearance_mode('dark')
-                    ctk.set_default_color_theme('dark-blue')
                 except Exception:
                     pass
             else:
@@ -236,18 +236,7 @@ class MyLocalAPIApp:
         self.main_window.root.lift()
         self.main_window.root.focus_force()
 
-        # Ensure the taskbar icon is applied (some platforms/Timings require reapplying after show)
-        try:
-            if hasattr(self.main_window, '_ensure_taskbar_icon'):
-                # Schedule slightly after show to ensure the HWND is valid/mapped
-                self.main_window.root.after(50, lambda: self.main_window._ensure_taskbar_icon())
-                # Secondary attempt after a longer delay to increase reliability
-                try:
-                    self.main_window.root.after(500, lambda: self.main_window._ensure_taskbar_icon())
-                except Exception:
-                    pass
-        except Exception:
-            pass
+        # The window reapplies its taskbar icon itself when it is mapped
         
         # Try to bring to front on Windows
         try:
@@ -285,7 +274,7 @@ class MyLocalAPIApp:
             
             self.update_tray_menu()
             if self.main_window:
-                self.main_window.update_server_status()
+                self.main_window.on_server_state_changed()
             return True
         except Exception as e:
             messagebox.showerror("Server Error", f"Failed to start server: {str(e)}")
@@ -298,7 +287,7 @@ class MyLocalAPIApp:
             self.flask_server = None
         self.update_tray_menu()
         if self.main_window:
-            self.main_window.update_server_status()
+            self.main_window.on_server_state_changed()
             
     def restart_server(self):
         """Restart the Flask server"""
@@ -165,7 +165,11 @@ class FlaskServer:
                 if not 0 <= percent <= 100:
                     return jsonify({"error": "Percent must be 0-100"}), 400
                 
-                success = self.audio_controller.set_volume(percent)
+                # Clients driving a slider hit this endpoint in bursts
+                success = self.audio_controller.set_volume_debounced(percent)
+                if success is None:
+                    # Coalesced into a burst; applied when the burst settles
+                    return jsonify({"ok": True, "queued": True, "percent": percent})
                 if success:
                     return jsonify({"ok": True, "percent": percent})
                 else:
@@ -88,6 +88,7 @@ class SettingsManager:
                 
                 # Merge with defaults to ensure all keys exist
                 settings = self._deep_merge(copy.deepcopy(self.DEFAULT_SETTINGS), loaded_settings)
+                self._normalize_audio_mappings(settings.get('audio', {}).get('mappings', []))
                 logger.info(f"Loaded settings from {self.settings_file}")
                 return settings
             else:
@@ -158,6 +159,16 @@ class SettingsManager:
             return self.save_settings()
         return True
     
+    @staticmethod
+    def _normalize_audio_mappings(mappings: List[Dict[str, Any]]) -> None:
+        """Strip label/device_id whitespace once so lookups can compare them directly"""
+        for mapping in mappings:
+            if not isinstance(mapping, dict):
+                continue
+            for key in ('label', 'device_id'):
+                if isinstance(mapping.get(key), str):
+                    mapping[key] = mapping[key].strip()
+    
     def get_audio_mappings(self) -> List[Dict[str, Any]]:
         """Get audio device mappings"""
         return self.get_setting('audio.mappings', [])
@@ -173,6 +184,8 @@ class SettingsManager:
             if not mapping.get('label', '').strip() or not mapping.get('device_id', '').strip():
                 return False
         
+        self._normalize_audio_mappings(mappings)
+        
         # Ensure only one mapping has use_for_streaming=True
         streaming_count = sum(1 for m in mappings if m.get('use_for_streaming', False))
         if streaming_count > 1:
@@ -338,17 +351,21 @@ class SettingsManager:
     def parse_fan_configs(self) -> List[str]:
         """Parse available fan configuration names from config directory"""
         config_path = self.get_setting('fan.fan_config_path', '').strip()
-        if not config_path or not os.path.exists(config_path):
+        if not config_path:
             return []
         
         try:
             config_files = []
-            for filename in os.listdir(config_path):
-                if filename.endswith('.json'):
-                    config_name = os.path.splitext(filename)[0]
-                    config_files.append(config_name)
+            # scandir's entry type comes with the listing, so filtering out
+            # non-files costs no extra stat and no up-front exists() check
+            with os.scandir(config_path) as entries:
+                for entry in entries:
+                    if entry.name.endswith('.json') and entry.is_file():
+                        config_files.append(entry.name[:-5])  # strip '.json'
             
             return sorted(config_files)
+        except FileNotFoundError:
+            return []
         except OSError as e:
             logger.error(f"Error reading fan config directory: {e}")
             return []
@@ -241,9 +241,9 @@ class StreamingController:
                     import psutil
                     
                     # Look for processes that might be Apple TV
-                    for proc in psutil.process_iter(['pid', 'name']):
+                    for proc in psutil.process_iter(['name']):
                         try:
-                            proc_name = proc.info['name'].lower()
+                            proc_name = (proc.info['name'] or '').lower()
                             if 'appletv' in proc_name or 'apple' in proc_name:
                                 # Try to focus this process
                                 focused = self._focus_window_by_title("apple", timeout=1)
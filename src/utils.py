@@ -10,6 +10,7 @@ Disclaimer: Provided AS IS. See README.md 'AS IS Disclaimer' for details.
 """
 
 import os
+import re
 import sys
 import logging
 import socket
@@ -18,6 +19,10 @@ import winreg
 from pathlib import Path
 from typing import Optional, List, Dict, Any
 
+# svcl.exe output cleanup patterns for clean_audio_device_id
+_ITEMS_FOUND_RE = re.compile(r'^\d+\s+items?\s+found:\s*', re.IGNORECASE)
+_RENDER_ID_RE = re.compile(r'([^\\]+\\Device\\[^\\]+\\Render)', re.IGNORECASE)
+
 def get_app_data_dir() -> str:
     """Get application data directory"""
     if sys.platform == 'win32':
@@ -258,13 +263,23 @@ class AutostartManager:
             return False
 
 def run_subprocess_safe(cmd: List[str], timeout: int = 30, 
-                       capture_output: bool = True) -> subprocess.CompletedProcess:
-    """Run subprocess with safe error handling and timeout"""
+                       capture_output: bool = True, text: bool = True,
+                       capture_stderr: bool = True) -> subprocess.CompletedProcess:
+    """Run subprocess with safe error handling and timeout
+    
+    Pass text=False to get raw bytes back and decode only what is needed.
+    Pass capture_stderr=False to discard stderr (result.stderr is None).
+    """
+    if capture_output and not capture_stderr:
+        streams = {'stdout': subprocess.PIPE, 'stderr': subprocess.DEVNULL}
+    else:
+        streams = {'capture_output': capture_output}
+    
     try:
         return subprocess.run(
             cmd,
-            capture_output=capture_output,
-            text=True,
+            **streams,
+            text=text,
             timeout=timeout,
             creationflags=subprocess.CREATE_NO_WINDOW if sys.platform == 'win32' else 0
         )
@@ -518,11 +533,10 @@ def clean_audio_device_id(device_id: Optional[str]) -> str:
     device_id = device_id.strip()
 
     # Remove "X items found:" prefix if present
-    import re
-    device_id = re.sub(r'^\d+\s+items?\s+found:\s*', '', device_id, flags=re.IGNORECASE)
+    device_id = _ITEMS_FOUND_RE.sub('', device_id)
 
     # Extract the actual device ID if it's embedded in other text
-    match = re.search(r'([^\\]+\\Device\\[^\\]+\\Render)', device_id, re.IGNORECASE)
+    match = _RENDER_ID_RE.search(device_id)
     if match:
         return match.group(1)
 
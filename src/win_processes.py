@@ -0,0 +1,145 @@
+#!/usr/bin/env python3
+"""
+Lightweight Windows process lookups via the Win32 API
+Finds processes by executable name without building psutil objects per PID
+
+Author: Aidan Paetsch
+Date: 2025-09-15
+License: See LICENSE (GNU GPL v3.0)
+Disclaimer: Provided AS IS. See README.md 'AS IS Disclaimer' for details.
+"""
+
+import sys
+import logging
+from typing import List, Optional
+
+logger = logging.getLogger(__name__)
+
+TH32CS_SNAPPROCESS = 0x00000002
+SYNCHRONIZE = 0x00100000
+MAXIMUM_WAIT_OBJECTS = 64
+WAIT_TIMEOUT = 0x102
+WAIT_FAILED = 0xFFFFFFFF
+ERROR_INVALID_PARAMETER = 87
+
+_api = None
+
+
+def _load_api():
+    """Load and prototype the kernel32 functions on first use"""
+    global _api
+    if _api is None:
+        import ctypes
+        from ctypes import wintypes
+
+        class PROCESSENTRY32W(ctypes.Structure):
+            _fields_ = [
+                ('dwSize', wintypes.DWORD),
+                ('cntUsage', wintypes.DWORD),
+                ('th32ProcessID', wintypes.DWORD),
+                ('th32DefaultHeapID', ctypes.c_size_t),
+                ('th32ModuleID', wintypes.DWORD),
+                ('cntThreads', wintypes.DWORD),
+                ('th32ParentProcessID', wintypes.DWORD),
+                ('pcPriClassBase', wintypes.LONG),
+                ('dwFlags', wintypes.DWORD),
+                ('szExeFile', wintypes.WCHAR * 260),
+            ]
+
+        kernel32 = ctypes.WinDLL('kernel32', use_last_error=True)
+
+        kernel32.CreateToolhelp32Snapshot.argtypes = [wintypes.DWORD, wintypes.DWORD]
+        kernel32.CreateToolhelp32Snapshot.restype = wintypes.HANDLE
+        kernel32.Process32FirstW.argtypes = [wintypes.HANDLE, ctypes.POINTER(PROCESSENTRY32W)]
+        kernel32.Process32FirstW.restype = wintypes.BOOL
+        kernel32.Process32NextW.argtypes = [wintypes.HANDLE, ctypes.POINTER(PROCESSENTRY32W)]
+        kernel32.Process32NextW.restype = wintypes.BOOL
+        kernel32.OpenProcess.argtypes = [wintypes.DWORD, wintypes.BOOL, wintypes.DWORD]
+        kernel32.OpenProcess.restype = wintypes.HANDLE
+        kernel32.CloseHandle.argtypes = [wintypes.HANDLE]
+        kernel32.CloseHandle.restype = wintypes.BOOL
+        kernel32.WaitForMultipleObjects.argtypes = [wintypes.DWORD, ctypes.POINTER(wintypes.HANDLE),
+                                                    wintypes.BOOL, wintypes.DWORD]
+        kernel32.WaitForMultipleObjects.restype = wintypes.DWORD
+
+        _api = (ctypes, wintypes, kernel32, PROCESSENTRY32W)
+    return _api
+
+
+def find_process_ids(exe_name: str, first_only: bool = False) -> Optional[List[int]]:
+    """Find PIDs whose executable file name matches exe_name (case-insensitive)
+
+    Walks one Toolhelp32 process snapshot, which carries every process's
+    executable name, so no process has to be opened. Returns None when the
+    Win32 API is unavailable so callers can fall back to psutil.
+    """
+    if sys.platform != 'win32':
+        return None
+
+    try:
+        ctypes, wintypes, kernel32, PROCESSENTRY32W = _load_api()
+        snapshot = kernel32.CreateToolhelp32Snapshot(TH32CS_SNAPPROCESS, 0)
+        if not snapshot or snapshot == wintypes.HANDLE(-1).value:
+            raise ctypes.WinError(ctypes.get_last_error())
+
+        try:
+            target = exe_name.lower()
+            entry = PROCESSENTRY32W()
+            entry.dwSize = ctypes.sizeof(PROCESSENTRY32W)
+            matches = []
+
+            ok = kernel32.Process32FirstW(snapshot, ctypes.byref(entry))
+            while ok:
+                if entry.szExeFile.lower() == target:
+                    matches.append(entry.th32ProcessID)
+                    if first_only:
+                        break
+                ok = kernel32.Process32NextW(snapshot, ctypes.byref(entry))
+            return matches
+        finally:
+            kernel32.CloseHandle(snapshot)
+
+    except Exception as e:
+        logger.debug(f"Win32 process lookup failed: {e}")
+        return None
+
+
+def wait_for_exit(pids: List[int], timeout_ms: int) -> Optional[bool]:
+    """Wait for all given processes to exit within one shared timeout
+
+    Returns True when every process has exited, False on timeout, or None
+    when the Win32 API is unavailable, a process can't be opened for waiting,
+    or there are too many processes for a single wait, so callers can fall
+    back to psutil.
+    """
+    if sys.platform != 'win32' or len(pids) > MAXIMUM_WAIT_OBJECTS:
+        return None
+
+    try:
+        ctypes, wintypes, kernel32, _ = _load_api()
+        handles = []
+        try:
+            for pid in pids:
+                handle = kernel32.OpenProcess(SYNCHRONIZE, False, pid)
+                if handle:
+                    handles.append(handle)
+                    continue
+                # Only a PID that no longer exists means the process exited;
+                # e.g. access denied on an elevated process says nothing
+                if ctypes.get_last_error() != ERROR_INVALID_PARAMETER:
+                    return None
+            if not handles:
+                return True
+
+            array = (wintypes.HANDLE * len(handles))(*handles)
+            result = kernel32.WaitForMultipleObjects(len(handles), array, True, timeout_ms)
+            if result == WAIT_FAILED:
+                return None
+            return result != WAIT_TIMEOUT
+        finally:
+            for handle in handles:
+                kernel32.CloseHandle(handle)
+
+    except Exception as e:
+        logger.debug(f"Win32 process wait failed: {e}")
+        return None
@@ -7,10 +7,12 @@ they run quickly and deterministically on CI and developer machines.
 """
 
 import subprocess
+import threading
+import time
 import unittest
 from unittest.mock import patch, MagicMock
 
-from audio_control import AudioController
+from audio_control import AudioController, _CoreAudioThread
 
 
 def _cp(stdout: str = "", stderr: str = "", returncode: int = 0):
@@ -24,8 +26,10 @@ class TestAudioController(unittest.TestCase):
         self.addCleanup(patcher.stop)
         self.mock_find = patcher.start()
 
-        # Create controller instance
+        # Create controller instance; keep volume control on the (mocked)
+        # svcl.exe path even where pycaw happens to be installed
         self.controller = AudioController()
+        self.controller._pycaw_available = False
 
     def test_parse_volume_variants(self):
         self.assertEqual(self.controller._parse_volume('45%'), 45)
@@ -43,7 +47,7 @@ class TestAudioController(unittest.TestCase):
         csv_text += 'Speakers,DeviceA,Render,Yes,No,No,50%,ID\\\\One\n'
         csv_text += 'Microphone,DeviceB,Capture,No,No,No,0%,ID\\\\Two\n'
 
-        mock_run.return_value = _cp(stdout=csv_text, returncode=0)
+        mock_run.return_value = _cp(stdout=csv_text.encode('utf-8'), returncode=0)
 
         result = self.controller.get_devices_raw()
         self.assertTrue(result['ok'])
@@ -55,12 +59,48 @@ class TestAudioController(unittest.TestCase):
     def test_get_devices_raw_bom_handling(self, mock_run):
         csv_text = '\ufeffName,Device Name,Direction,Default,Default Multimedia,Default Communications,Volume Percent,Command-Line Friendly ID\n'
         csv_text += 'Speakers,DeviceA,Render,Yes,No,No,25%,ID\\\\One\n'
-        mock_run.return_value = _cp(stdout=csv_text, returncode=0)
+        mock_run.return_value = _cp(stdout=csv_text.encode('utf-8'), returncode=0)
 
         result = self.controller.get_devices_raw()
         self.assertTrue(result['ok'])
         self.assertEqual(result['rows'][0]['Name'], 'Speakers')
 
+        # Output is decoded as UTF-8 regardless of the console code page
+        self.controller.invalidate_cache()
+        mock_run.return_value = _cp(stdout=csv_text.replace('Speakers', 'Haut-parleurs é').encode('utf-8'), returncode=0)
+        result = self.controller.get_devices_raw()
+        self.assertTrue(result['ok'])
+        self.assertEqual(result['rows'][0]['Name'], 'Haut-parleurs é')
+
+    @patch('audio_control.run_subprocess_safe')
+    def test_get_devices_raw_quoted_fields(self, mock_run):
+        csv_text = 'Name,Device Name,Direction,Default,Default Multimedia,Default Communications,Volume Percent,Command-Line Friendly ID\r\n'
+        csv_text += '"Speakers, Front",DeviceA,Render,Render,No,No,50%,ID\\\\One\r\n'
+        csv_text += 'Microphone,DeviceB,Capture,No,No,No,0%,ID\\\\Two\r\n'
+        mock_run.return_value = _cp(stdout=csv_text.encode('utf-8'), returncode=0)
+
+        result = self.controller.get_devices_raw()
+        self.assertTrue(result['ok'])
+        self.assertEqual(result['rows'][0]['Name'], 'Speakers, Front')
+        self.assertEqual(result['rows'][1]['Command-Line Friendly ID'], 'ID\\\\Two')
+
+    @patch('audio_control.run_subprocess_safe')
+    def test_get_devices_raw_cached_until_invalidated(self, mock_run):
+        csv_text = 'Name,Device Name,Direction,Default,Default Multimedia,Default Communications,Volume Percent,Command-Line Friendly ID\n'
+        csv_text += 'Speakers,DeviceA,Render,Yes,No,No,50%,ID\\\\One\n'
+        mock_run.return_value = _cp(stdout=csv_text.encode('utf-8'), returncode=0)
+
+        first = self.controller.get_devices_raw()
+        second = self.controller.get_devices_raw()
+        self.assertTrue(second['ok'])
+        self.assertIs(first, second)
+        self.assertEqual(mock_run.call_count, 1)
+
+        # A successful mutation drops the cached dump
+        self.assertTrue(self.controller.set_volume(40))
+        self.controller.get_devices_raw()
+        self.assertEqual(mock_run.call_count, 3)
+
     def test_get_playback_devices_filters(self):
         # Patch get_devices_raw to return mixed directions
         with patch.object(self.controller, 'get_devices_raw', return_value={
@@ -82,21 +122,61 @@ class TestAudioController(unittest.TestCase):
         # First call returns the default device id
         mock_run.side_effect = [
             _cp(stdout='ID\\Default\n', returncode=0),  # GetColumnValue
-            _cp(stdout='55', returncode=0)  # GetPercent
+            _cp(stdout='55', returncode=0),  # GetPercent
+            _cp(stdout='Default\n', returncode=0),  # GetColumnValue Name
+            _cp(stdout='DevDefault\n', returncode=0)  # GetColumnValue Device Name
+        ]
+        mock_clean.return_value = 'ID\\Default'
+
+        # Force the column-by-column fallback; the full device list should
+        # not be needed when the name lookups succeed
+        with patch.object(self.controller, 'get_devices_raw', return_value={'ok': False, 'rows': []}), \
+                patch.object(self.controller, 'get_playback_devices') as mock_devices:
+            res = self.controller.get_current_default_device()
+            self.assertTrue(res['ok'])
+            self.assertEqual(res['device_id'], 'ID\\Default')
+            self.assertEqual(res['volume'], 55)
+            self.assertEqual(res['device_name'], 'DevDefault')
+            self.assertEqual(res['name'], 'Default')
+            mock_devices.assert_not_called()
+
+    @patch('audio_control.run_subprocess_safe')
+    @patch('audio_control.clean_audio_device_id')
+    def test_get_current_default_device_falls_back_to_device_list(self, mock_clean, mock_run):
+        mock_run.side_effect = [
+            _cp(stdout='ID\\Default\n', returncode=0),  # GetColumnValue
+            _cp(stdout='55', returncode=0),  # GetPercent
+            _cp(returncode=1, stderr='err'),  # GetColumnValue Name
+            _cp(returncode=1, stderr='err')  # GetColumnValue Device Name
         ]
         mock_clean.return_value = 'ID\\Default'
 
-        # Patch get_playback_devices to return a matching device
-        with patch.object(self.controller, 'get_playback_devices', return_value={
+        # Dump without a default flag, but which still lists the device
+        with patch.object(self.controller, 'get_devices_raw', return_value={
             'ok': True,
-            'devices': [
-                {'device_id': 'ID\\Default', 'device_name': 'DevDefault', 'name': 'Default', 'volume_percent': 55}
+            'rows': [
+                {'Name': 'Default', 'Device Name': 'DevDefault', 'Direction': 'Render', 'Default': '',
+                 'Volume Percent': '55', 'Command-Line Friendly ID': 'ID\\Default'}
             ]
         }):
             res = self.controller.get_current_default_device()
             self.assertTrue(res['ok'])
-            self.assertEqual(res['device_id'], 'ID\\Default')
-            self.assertEqual(res['volume'], 55)
+            self.assertEqual(res['device_name'], 'DevDefault')
+
+    @patch('audio_control.run_subprocess_safe')
+    def test_get_current_default_device_from_single_dump(self, mock_run):
+        csv_text = 'Name,Device Name,Direction,Default,Default Multimedia,Default Communications,Volume Percent,Command-Line Friendly ID\n'
+        csv_text += 'Speakers,DeviceA,Render,,,,10%,DeviceA\\Device\\Speakers\\Render\n'
+        csv_text += 'Headset,DeviceB,Render,Render,Render,,42%,DeviceB\\Device\\Headset\\Render\n'
+        mock_run.return_value = _cp(stdout=csv_text.encode('utf-8'), returncode=0)
+
+        res = self.controller.get_current_default_device()
+        self.assertTrue(res['ok'])
+        self.assertEqual(res['device_id'], 'DeviceB\\Device\\Headset\\Render')
+        self.assertEqual(res['device_name'], 'DeviceB')
+        self.assertEqual(res['volume'], 42)
+        self.assertEqual(self.controller.get_current_volume(), 42)
+        self.assertEqual(mock_run.call_count, 1)
 
     def test_set_default_device_validation(self):
         with self.assertRaises(ValueError):
@@ -124,6 +204,77 @@ class TestAudioController(unittest.TestCase):
         mock_run.return_value = _cp(returncode=1, stderr='fail')
         self.assertFalse(self.controller.set_volume(30, device_id='ID\\One'))
 
+    @patch('audio_control.run_subprocess_safe')
+    def test_set_volume_prefers_pycaw_for_default_device(self, mock_run):
+        endpoint = MagicMock()
+        with patch.object(self.controller, '_run_on_default_endpoint', side_effect=lambda fn: (True, fn(endpoint))):
+            self.assertTrue(self.controller.set_volume(25))
+            endpoint.SetMasterVolumeLevelScalar.assert_called_once_with(0.25, None)
+            mock_run.assert_not_called()
+
+            # Explicit device IDs still go through svcl.exe
+            mock_run.return_value = _cp(returncode=0)
+            self.assertTrue(self.controller.set_volume(25, device_id='ID\\One'))
+            mock_run.assert_called_once()
+
+    @patch('audio_control.run_subprocess_safe')
+    def test_get_current_volume_prefers_pycaw_for_default_device(self, mock_run):
+        endpoint = MagicMock()
+        endpoint.GetMasterVolumeLevelScalar.return_value = 0.374
+        with patch.object(self.controller, '_run_on_default_endpoint', side_effect=lambda fn: (True, fn(endpoint))):
+            self.assertEqual(self.controller.get_current_volume(), 37)
+            mock_run.assert_not_called()
+
+    def test_set_volume_debounced_coalesces_burst(self):
+        with patch.object(self.controller, 'set_volume', return_value=True) as mock_set:
+            self.assertTrue(self.controller.set_volume_debounced(10, delay=60))
+            # Queued calls report that nothing was applied yet
+            self.assertIsNone(self.controller.set_volume_debounced(20, delay=60))
+            self.assertIsNone(self.controller.set_volume_debounced(30, delay=60))
+            self.assertIsNone(self.controller.set_volume_debounced(40, 'ID\\Two', delay=60))
+            mock_set.assert_called_once_with(10, None)
+
+            # Closing the window applies the latest queued value per device
+            self.controller._volume_timer.cancel()
+            self.controller._flush_volume()
+            self.assertEqual(mock_set.call_count, 3)
+            mock_set.assert_any_call(30, None)
+            mock_set.assert_any_call(40, 'ID\\Two')
+
+    def test_set_volume_debounced_waits_for_slow_apply(self):
+        applied = []
+        active = []
+
+        def slow_set(percent, device_id=None):
+            active.append(percent)
+            overlapping = len(active) > 1
+            if percent == 10:
+                # Slower than the debounce window
+                time.sleep(0.2)
+            applied.append((percent, overlapping))
+            active.remove(percent)
+            return True
+
+        with patch.object(self.controller, 'set_volume', side_effect=slow_set):
+            first = threading.Thread(target=self.controller.set_volume_debounced, args=(10,),
+                                     kwargs={'delay': 0.1})
+            first.start()
+            time.sleep(0.03)
+            self.assertIsNone(self.controller.set_volume_debounced(30, delay=0.1))
+            first.join()
+            deadline = time.time() + 2
+            while len(applied) < 2 and time.time() < deadline:
+                time.sleep(0.01)
+
+        # The queued value lands after the slow one, never alongside it
+        self.assertEqual(applied, [(10, False), (30, False)])
+
+    def test_set_volume_debounced_skips_superseded_value(self):
+        with patch.object(self.controller, 'set_volume', return_value=True) as mock_set:
+            self.controller._applied_volume_seq[None] = 5
+            self.assertIsNone(self.controller._apply_volume_in_order(3, 10, None))
+            mock_set.assert_not_called()
+
     @patch('audio_control.run_subprocess_safe')
     def test_get_current_volume(self, mock_run):
         mock_run.return_value = _cp(stdout='77', returncode=0)
@@ -153,6 +304,27 @@ class TestAudioController(unittest.TestCase):
             self.assertFalse(snap['matched'])
             self.assertEqual(snap['active_key'], 'unknown')
 
+    @patch('audio_control.run_subprocess_safe')
+    def test_get_audio_snapshot_reused_while_dump_unchanged(self, mock_run):
+        csv_text = 'Name,Device Name,Direction,Default,Default Multimedia,Default Communications,Volume Percent,Command-Line Friendly ID\n'
+        csv_text += 'Headset,DeviceB,Render,Render,Render,,42%,DeviceB\\Device\\Headset\\Render\n'
+        mock_run.return_value = _cp(stdout=csv_text.encode('utf-8'), returncode=0)
+        mappings = [{'label': 'headset', 'device_id': 'DeviceB\\Device\\Headset\\Render'}]
+
+        first = self.controller.get_audio_snapshot(mappings)
+        self.assertTrue(first['matched'])
+        self.assertEqual(first['active_key'], 'headset')
+
+        with patch.object(self.controller, 'get_current_default_device') as mock_current:
+            second = self.controller.get_audio_snapshot(mappings)
+            mock_current.assert_not_called()
+        self.assertEqual(first, second)
+
+        # Changed mappings are matched again
+        third = self.controller.get_audio_snapshot([{'label': 'other', 'device_id': 'X'}])
+        self.assertFalse(third['matched'])
+        self.assertEqual(mock_run.call_count, 1)
+
     def test_switch_to_device_by_key(self):
         mappings = [{'label': 'one', 'device_id': 'ID\\One'}]
 
@@ -191,5 +363,69 @@ class TestAudioController(unittest.TestCase):
                     self.assertEqual(res['devices_found'], 2)
 
 
+
+class TestCoreAudioThread(unittest.TestCase):
+    """The pycaw worker, with comtypes and pycaw replaced by fakes"""
+
+    def setUp(self):
+        self.device_id = 'speakers'
+        self.com_threads = []
+        self.activations = 0
+
+        def co_initialize():
+            self.com_threads.append(threading.current_thread().name)
+
+        def activate(*args):
+            self.activations += 1
+            return MagicMock(name=f'endpoint-{self.activations}')
+
+        device = MagicMock()
+        device.GetId.side_effect = lambda: self.device_id
+        device.Activate.side_effect = activate
+        enumerator = MagicMock()
+        enumerator.GetDefaultAudioEndpoint.return_value = device
+
+        comtypes = MagicMock(CoInitialize=co_initialize)
+        comtypes.CoCreateInstance.return_value = enumerator
+        pycaw_mod = MagicMock()
+        modules = {'comtypes': comtypes, 'pycaw': MagicMock(pycaw=pycaw_mod), 'pycaw.pycaw': pycaw_mod}
+        for target in [patch.dict('sys.modules', modules),
+                       patch('ctypes.cast', lambda obj, typ: obj),
+                       patch('ctypes.POINTER', lambda typ: typ)]:
+            target.start()
+            self.addCleanup(target.stop)
+
+    def test_calls_share_one_com_thread_and_endpoint(self):
+        worker = _CoreAudioThread()
+        seen = []
+        call = lambda: worker.call(lambda ep: seen.append((threading.current_thread().name, ep)))
+        callers = [threading.Thread(target=call) for _ in range(3)]
+        for t in callers:
+            t.start()
+        for t in callers:
+            t.join()
+
+        # COM initialized once, every call on that thread with one activation
+        self.assertEqual(self.com_threads, ['CoreAudio'])
+        self.assertEqual({name for name, _ in seen}, {'CoreAudio'})
+        self.assertEqual(len({id(ep) for _, ep in seen}), 1)
+        self.assertEqual(self.activations, 1)
+
+        # A new default device gets a fresh endpoint
+        self.device_id = 'headphones'
+        worker.call(lambda ep: None)
+        self.assertEqual(self.activations, 2)
+
+    def test_errors_are_raised_to_the_caller(self):
+        worker = _CoreAudioThread()
+
+        def fail(endpoint):
+            raise OSError('device gone')
+
+        with self.assertRaises(OSError):
+            worker.call(fail)
+        self.assertEqual(worker.call(lambda ep: 5), 5)
+
+
 if __name__ == '__main__':
     unittest.main()
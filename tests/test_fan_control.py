@@ -1,9 +1,11 @@
 import os
 import subprocess
+import sys
 import types
 import time
 import json
 
+import psutil
 import pytest
 
 from fan_control import FanController
@@ -14,6 +16,7 @@ class DummyProc:
         self.pid = pid
         self.info = {'name': name, 'exe': exe_path}
         self._exe = exe_path
+        self._alive = True
 
     def exe(self):
         return self._exe
@@ -22,13 +25,16 @@ class DummyProc:
         return 123456.0
 
     def terminate(self):
-        return None
+        self._alive = False
 
     def wait(self, timeout=None):
         return None
 
     def kill(self):
-        return None
+        self._alive = False
+
+    def is_running(self):
+        return self._alive
 
 
 def test_get_fancontrol_processes_and_running_and_exe(monkeypatch):
@@ -48,6 +54,98 @@ def test_get_fancontrol_processes_and_running_and_exe(monkeypatch):
     assert fc.get_running_exe_path() == r'C:\Program\FanControl\FanControl.exe'
 
 
+def test_psutil_lookup_matches_exact_exe_name(monkeypatch):
+    # Same rule as the native Toolhelp lookup: the exe name, ignoring case
+    p1 = DummyProc(1, 'fancontrol.EXE', r'C:\FanControl\FanControl.exe')
+    p2 = DummyProc(2, 'FanControlHelper.exe', r'C:\FanControl\FanControlHelper.exe')
+    monkeypatch.setattr('psutil.process_iter', lambda attrs: iter([p1, p2]))
+    monkeypatch.setattr('fan_control.find_process_ids', lambda *a, **k: None)
+
+    fc = FanController(fan_exe_path='', fan_config_path='')
+    assert [p.pid for p in fc.get_fancontrol_processes()] == [1]
+
+
+def test_get_fancontrol_processes_reuses_recent_scan(monkeypatch):
+    p1 = DummyProc(1, 'FanControl.exe', r'C:\FanControl\FanControl.exe')
+    scans = []
+
+    def fake_iter(attrs):
+        scans.append(attrs)
+        yield p1
+
+    monkeypatch.setattr('psutil.process_iter', lambda attrs: fake_iter(attrs))
+
+    fc = FanController(fan_exe_path=r'C:\FanControl\FanControl.exe', fan_config_path='')
+    assert fc.get_fancontrol_processes() == [p1]
+    assert fc.is_running() is True
+    assert fc.get_fancontrol_processes() == [p1]
+    assert len(scans) == 1
+
+    # Forced refreshes and invalidation both rescan
+    fc.get_fancontrol_processes(force=True)
+    fc._invalidate_proc_cache()
+    fc.get_fancontrol_processes()
+    assert len(scans) == 3
+
+
+def test_get_fancontrol_processes_uses_native_pid_lookup(monkeypatch):
+    # When the Win32 lookup is available psutil enumeration is skipped
+    monkeypatch.setattr('fan_control.find_process_ids', lambda name: [os.getpid()])
+    monkeypatch.setattr('psutil.process_iter', lambda attrs: pytest.fail('process_iter called'))
+
+    fc = FanController(fan_exe_path=r'C:\FanControl\FanControl.exe', fan_config_path='')
+    procs = fc.get_fancontrol_processes()
+    assert [p.pid for p in procs] == [os.getpid()]
+
+
+def test_native_lookup_reuses_handles_across_scans(monkeypatch):
+    monkeypatch.setattr('fan_control.find_process_ids', lambda name: [os.getpid()])
+
+    fc = FanController(fan_exe_path=r'C:\FanControl\FanControl.exe', fan_config_path='')
+    first = fc.get_fancontrol_processes()
+    fc._invalidate_proc_cache()
+    second = fc.get_fancontrol_processes()
+    assert second[0] is first[0]
+
+
+def test_is_running_stops_at_first_native_match(monkeypatch):
+    seen = {}
+
+    def fake_find(name, first_only=False):
+        seen['first_only'] = first_only
+        return [1234]
+
+    monkeypatch.setattr('fan_control.find_process_ids', fake_find)
+    monkeypatch.setattr('psutil.process_iter', lambda attrs: pytest.fail('process_iter called'))
+
+    fc = FanController(fan_exe_path=r'C:\FanControl\FanControl.exe', fan_config_path='')
+    assert fc.is_running() is True
+    assert seen['first_only'] is True
+
+
+def test_running_process_handle_is_reused_until_invalidated(monkeypatch):
+    p1 = DummyProc(1, 'FanControl.exe', r'C:\FanControl\FanControl.exe')
+    scans = []
+
+    def fake_iter(attrs):
+        scans.append(attrs)
+        if p1.is_running():
+            yield p1
+
+    monkeypatch.setattr('psutil.process_iter', lambda attrs: fake_iter(attrs))
+
+    fc = FanController(fan_exe_path='', fan_config_path='')
+    fc._proc_cache_ttl = 0  # only the held handle may avoid a scan
+    assert fc.get_running_exe_path() == r'C:\FanControl\FanControl.exe'
+    assert fc.is_running() is True
+    assert fc.get_running_exe_path() == r'C:\FanControl\FanControl.exe'
+    assert len(scans) == 1
+
+    p1.kill()
+    assert fc.get_running_exe_path() is None
+    assert len(scans) == 2
+
+
 def test_stop_fancontrol_sequence(monkeypatch):
     # Simulate the sequence of get_fancontrol_processes calls used by stop_fancontrol
     p = DummyProc(5, 'FanControl.exe', r'C:\FanControl\FanControl.exe')
@@ -67,14 +165,69 @@ def test_stop_fancontrol_sequence(monkeypatch):
     assert result is True
 
 
+def test_stop_fancontrol_escalates_without_reenumerating(monkeypatch):
+    class Stubborn(DummyProc):
+        def terminate(self):
+            pass
+
+    p = Stubborn(5, 'FanControl.exe')
+    calls = []
+
+    def enumerate_procs():
+        calls.append(1)
+        return [p] if len(calls) == 1 else []
+
+    fc = FanController(fan_exe_path=r'C:\FanControl\FanControl.exe', fan_config_path='')
+    fc.get_fancontrol_processes = enumerate_procs
+    monkeypatch.setattr(fc, '_wait_for_exit', lambda procs, timeout: False)
+
+    assert fc.stop_fancontrol(force=False) is True
+    assert p.is_running() is False
+    # Initial lookup plus the final sanity check only
+    assert len(calls) == 2
+
+
+def test_wait_for_exit_returns_when_process_exits():
+    child = subprocess.Popen([sys.executable, '-c', 'import time; time.sleep(30)'])
+    try:
+        proc = psutil.Process(child.pid)
+        fc = FanController(fan_exe_path='', fan_config_path='')
+        assert fc._wait_for_exit([proc], timeout=0.2) is False
+
+        child.terminate()
+        start = time.monotonic()
+        assert fc._wait_for_exit([proc], timeout=10) is True
+        assert time.monotonic() - start < 5
+    finally:
+        child.kill()
+        child.wait()
+
+
+def test_win32_wait_treats_only_missing_pid_as_exited(monkeypatch):
+    import win_processes
+
+    last_error = {'code': 5}  # ERROR_ACCESS_DENIED, e.g. elevated FanControl
+    kernel32 = types.SimpleNamespace(OpenProcess=lambda *a: 0, CloseHandle=lambda h: True)
+    fake_ctypes = types.SimpleNamespace(get_last_error=lambda: last_error['code'])
+    monkeypatch.setattr(win_processes.sys, 'platform', 'win32')
+    monkeypatch.setattr(win_processes, '_api', (fake_ctypes, None, kernel32, None))
+
+    # Can't wait on it, so let the caller fall back instead of claiming exit
+    assert win_processes.wait_for_exit([1234], 100) is None
+    last_error['code'] = win_processes.ERROR_INVALID_PARAMETER
+    assert win_processes.wait_for_exit([1234], 100) is True
+
+
 def test_start_and_ensure_running(monkeypatch):
     # Ensure exe exists
     monkeypatch.setattr('os.path.exists', lambda p: True)
 
     started = {'called': False}
 
-    def fake_popen(args, creationflags=None):
+    def fake_popen(args, creationflags=None, **kwargs):
         started['called'] = True
+        # Launched detached from our stdio
+        assert kwargs.get('stdout') == subprocess.DEVNULL
         return types.SimpleNamespace(pid=999)
 
     monkeypatch.setattr('subprocess.Popen', fake_popen)
@@ -126,8 +279,23 @@ def test__switch_config_by_replacement_requires_admin(monkeypatch):
     assert fc._switch_config_by_replacement('somepath') is False
 
 
+def test_start_unelevated_quotes_paths_with_spaces(monkeypatch):
+    calls = []
+    fake_shell = types.SimpleNamespace(ShellExecute=lambda *a: calls.append(a))
+    monkeypatch.setattr('fan_control._shell_module', fake_shell)
+
+    fc = FanController(fan_exe_path='', fan_config_path='')
+    exe = r'C:\Program Files\FanControl\FanControl.exe'
+    cfg = r'C:\Users\me\AppData\Local\Fan Configs\50.json'
+    fc._start_unelevated([exe, '-m', '-c', cfg])
+
+    assert calls[0][1] == '-m -c "C:\\Users\\me\\AppData\\Local\\Fan Configs\\50.json"'
+    assert calls[0][2] == os.path.dirname(exe)
+
+
 def test_refresh_sensors_success_and_failure(monkeypatch):
-    fc = FanController(fan_exe_path=r'C:\FanControl\FanControl.exe', fan_config_path='')
+    fc = FanController(fan_exe_path=r'C:\FanControl\FanControl.exe', fan_config_path='',
+                       refresh_min_interval=0)
 
     # ensure_running True and get_running_exe_path returns an exe
     monkeypatch.setattr(fc, 'ensure_running', lambda: True)
@@ -142,10 +310,25 @@ def test_refresh_sensors_success_and_failure(monkeypatch):
     assert fc.refresh_sensors() is True
 
     # Simulate non-zero returncode
-    monkeypatch.setattr('subprocess.run', lambda *a, **k: CPR(returncode=1, stderr='err'))
+    monkeypatch.setattr('subprocess.run', lambda *a, **k: CPR(returncode=1, stderr=b'err'))
     assert fc.refresh_sensors() is False
 
 
+def test_refresh_sensors_rate_limited(monkeypatch):
+    fc = FanController(fan_exe_path=r'C:\FanControl\FanControl.exe', fan_config_path='',
+                       refresh_min_interval=60)
+    monkeypatch.setattr(fc, 'ensure_running', lambda: True)
+    monkeypatch.setattr(fc, 'get_running_exe_path', lambda: r'C:\FanControl\FanControl.exe')
+    monkeypatch.setattr(subprocess, 'CREATE_NO_WINDOW', 0x08000000, raising=False)
+
+    runs = []
+    monkeypatch.setattr('subprocess.run',
+                        lambda *a, **k: runs.append(a) or types.SimpleNamespace(returncode=0))
+    assert fc.refresh_sensors() is True
+    assert fc.refresh_sensors() is True
+    assert len(runs) == 1
+
+
 def test_get_config_files_and_summary(tmp_path):
     cfg_dir = tmp_path / 'configs'
     cfg_dir.mkdir()
@@ -164,6 +347,39 @@ def test_get_config_files_and_summary(tmp_path):
     assert summary['with_percentage'] >= 2
 
 
+def test_get_config_files_cached_until_directory_changes(tmp_path, monkeypatch):
+    cfg_dir = tmp_path / 'configs'
+    cfg_dir.mkdir()
+    (cfg_dir / '50.json').write_text('{}')
+
+    fc = FanController(fan_exe_path='', fan_config_path=str(cfg_dir))
+    assert [c['name'] for c in fc.get_config_files()] == ['50']
+
+    # A second call with an unchanged directory does not list it again
+    monkeypatch.setattr('os.scandir', lambda p: pytest.fail('directory re-listed'))
+    assert [c['name'] for c in fc.get_config_files()] == ['50']
+    monkeypatch.undo()
+
+    (cfg_dir / '75.json').write_text('{}')
+    os.utime(cfg_dir, ns=(0, os.stat(cfg_dir).st_mtime_ns + 1_000_000))
+    assert [c['name'] for c in fc.get_config_files()] == ['50', '75']
+
+
+def test_get_config_files_rescans_after_max_age(tmp_path, monkeypatch):
+    cfg_dir = tmp_path / 'configs'
+    cfg_dir.mkdir()
+    cfg = cfg_dir / '50.json'
+    cfg.write_text('{}')
+
+    fc = FanController(fan_exe_path='', fan_config_path=str(cfg_dir))
+    assert fc.get_config_files()[0]['size'] == 2
+
+    # In-place edits leave the directory stat alone; the age limit catches them
+    cfg.write_text('{"a": 1}')
+    monkeypatch.setattr('fan_control._CONFIG_MAX_AGE', 0.0)
+    assert fc.get_config_files()[0]['size'] == 8
+
+
 def test_set_fan_percentage_and_profile(tmp_path, monkeypatch):
     cfg_dir = tmp_path / 'configs'
     cfg_dir.mkdir()
@@ -194,6 +410,27 @@ def test_set_fan_percentage_and_profile(tmp_path, monkeypatch):
     assert res3['ok'] is True
     assert res3['profile'].lower() == 'cool'
 
+    # Unicode-aware case-insensitive match
+    (cfg_dir / 'Straße.json').write_text('{}')
+    os.utime(cfg_dir, ns=(0, os.stat(cfg_dir).st_mtime_ns + 1_000_000))
+    assert fc.set_fan_profile('STRASSE')['config_name'] == 'Straße'
+
+
+def test_set_fan_percentage_closest_matches_linear_scan(tmp_path, monkeypatch):
+    cfg_dir = tmp_path / 'configs'
+    cfg_dir.mkdir()
+    for name in ('a20', 'b20', '40', '70', 'quiet'):
+        (cfg_dir / f'{name}.json').write_text('{}')
+
+    fc = FanController(fan_exe_path='', fan_config_path=str(cfg_dir))
+    monkeypatch.setattr(fc, 'switch_config', lambda path: True)
+    pct_configs = [c for c in fc.get_config_files() if c['percentage'] is not None]
+
+    for requested in range(0, 101):
+        expected = min(pct_configs, key=lambda c: abs(c['percentage'] - requested))
+        res = fc.set_fan_percentage(requested)
+        assert res['config_name'] == expected['name'], requested
+
 
 def test_get_status_and_test_fan_system(monkeypatch, tmp_path):
     # Setup a fake running process and config dir
@@ -215,3 +452,141 @@ def test_get_status_and_test_fan_system(monkeypatch, tmp_path):
 
     testres = fc.test_fan_system()
     assert 'system_ready' in testres
+
+
+def test_status_scans_processes_and_configs_once(monkeypatch, tmp_path):
+    (tmp_path / '40.json').write_text('{}')
+    fc = FanController(fan_exe_path='', fan_config_path=str(tmp_path))
+    p = DummyProc(11, 'FanControl.exe', r'C:\FanControl\FanControl.exe')
+
+    calls = []
+    listed = fc.get_config_files()
+    monkeypatch.setattr(fc, 'get_fancontrol_processes', lambda: calls.append('procs') or [p])
+    monkeypatch.setattr(fc, 'get_config_files', lambda: calls.append('configs') or listed)
+
+    status = fc.get_status()
+    assert status['running'] is True
+    assert status['configs']['with_percentage'] == 1
+    assert calls == ['procs', 'configs']
+
+
+def test_counts_skip_config_dicts(monkeypatch, tmp_path):
+    (tmp_path / '40.json').write_text('{}')
+    (tmp_path / 'quiet.json').write_text('{}')
+    fc = FanController(fan_exe_path='', fan_config_path=str(tmp_path))
+    monkeypatch.setattr(fc, 'get_config_files', lambda: pytest.fail('config dicts built'))
+    monkeypatch.setattr(fc, 'is_running', lambda: False)
+
+    assert fc.count_configs() == (2, 1)
+    testres = fc.test_fan_system()
+    assert (testres['config_count'], testres['percentage_config_count']) == (2, 1)
+
+
+def test_wait_until_polls_until_predicate_or_timeout():
+    fc = FanController(fan_exe_path='', fan_config_path='')
+    results = iter([False, False, True])
+    assert fc._wait_until(lambda: next(results), timeout=2.0, initial=0.001) is True
+
+    start = time.monotonic()
+    assert fc._wait_until(lambda: False, timeout=0.05, initial=0.01) is False
+    assert time.monotonic() - start < 0.5
+
+
+def test_wait_until_places_polls_from_history():
+    fc = FanController(fan_exe_path='', fan_config_path='')
+    history = fc._start_latencies
+    history.extend([0.02] * 8)
+    checks = []
+
+    def pred():
+        checks.append(time.monotonic())
+        return len(checks) == 2
+
+    assert fc._wait_until(pred, timeout=1.0, initial=0.5, history=history) is True
+    # Second check lands at the historical median rather than after 0.5 s
+    assert checks[1] - checks[0] < 0.25
+    assert len(history) == 9
+
+
+def test_is_configured_cached_per_paths(monkeypatch):
+    checks = []
+
+    def fake_exists(path):
+        checks.append(path)
+        return True
+
+    fc = FanController(fan_exe_path='', fan_config_path='')
+    fc.fan_exe_path = r'C:\FanControl\FanControl.exe'
+    fc.fan_config_path = r'C:\FanControl\Configurations'
+    monkeypatch.setattr('os.path.exists', fake_exists)
+
+    assert fc.is_configured() is True
+    assert fc.is_configured() is True
+    assert len(checks) == 2
+
+    # Changing a path re-checks only that path, immediately
+    fc.fan_config_path = r'D:\Configs'
+    assert fc.is_configured() is True
+    assert len(checks) == 3
+
+    # Other callers share the memoized checks
+    assert fc.test_fan_system()['exe_exists'] is True
+    assert len(checks) == 3
+
+
+def test_missing_paths_are_rechecked(monkeypatch):
+    installed = set()
+    monkeypatch.setattr('os.path.exists', lambda p: p in installed)
+
+    exe = r'C:\FanControl\FanControl.exe'
+    fc = FanController(fan_exe_path=exe, fan_config_path='')
+    assert fc._path_exists(exe) is False
+
+    # Installing FanControl is seen right away, not after the TTL
+    installed.add(exe)
+    assert fc._path_exists(exe) is True
+    installed.clear()
+    assert fc._path_exists(exe) is True
+
+
+def test_switch_config_coalesces_concurrent_requests(monkeypatch, tmp_path):
+    import threading
+
+    paths = []
+    for name in ('30', '50', '80'):
+        cfg = tmp_path / f'{name}.json'
+        cfg.write_text('{}')
+        paths.append(str(cfg))
+
+    fc = FanController(fan_exe_path='', fan_config_path=str(tmp_path))
+    first_started = threading.Event()
+    release = threading.Event()
+    applied = []
+
+    def slow_switch(path):
+        applied.append(path)
+        first_started.set()
+        release.wait(2)
+        return True
+
+    monkeypatch.setattr(fc, '_switch_config_now', slow_switch)
+
+    results = []
+    runner = threading.Thread(target=lambda: results.append(fc.switch_config(paths[0])))
+    runner.start()
+    first_started.wait(2)
+
+    # Two more requests arrive while the first switch is in flight
+    waiters = [threading.Thread(target=lambda p=p: results.append(fc.switch_config(p)))
+               for p in paths[1:]]
+    for t in waiters:
+        t.start()
+    while fc._switch_requested < 3:
+        time.sleep(0.01)
+    release.set()
+    for t in [runner] + waiters:
+        t.join(2)
+
+    # Only the latest pending target is applied after the first one
+    assert applied == [paths[0], paths[2]]
+    assert results == [True, True, True]
@@ -25,12 +25,33 @@ def test_launch_game_by_steam_id_windows(monkeypatch):
         called['url'] = url
 
     monkeypatch.setattr(os, 'startfile', fake_startfile)
+    gc._steam_exe = None  # steam.exe not found: protocol URL fallback
 
     res = gc.launch_game_by_steam_id('12345')
     assert res['ok'] is True
     assert called.get('url') == 'steam://run/12345'
 
 
+def test_launch_game_by_steam_id_direct(monkeypatch):
+    gc = GamingController()
+    gc._steam_exe = 'C:\\Program Files (x86)\\Steam\\steam.exe'
+    started = {}
+
+    monkeypatch.setattr(os, 'name', 'nt', raising=False)
+    monkeypatch.setattr(subprocess, 'CREATE_NEW_PROCESS_GROUP', 0x200, raising=False)
+
+    def fake_popen(args, **kwargs):
+        started['args'] = args
+        return types.SimpleNamespace(pid=7)
+
+    monkeypatch.setattr(subprocess, 'Popen', fake_popen)
+    monkeypatch.setattr(os, 'startfile', lambda url: pytest.fail('used protocol URL'), raising=False)
+
+    res = gc.launch_game_by_steam_id('12345')
+    assert res['ok'] is True
+    assert started['args'] == [gc._steam_exe, '-applaunch', '12345']
+
+
 def test_launch_game_by_steam_id_posix(monkeypatch):
     gc = GamingController()
     called = {}
@@ -126,6 +147,17 @@ def test_get_audio_device_for_game():
     assert res2 is None
 
 
+def test_mapping_lookup_follows_mapping_changes():
+    gc = GamingController()
+    mappings = [{'label': 'Game A', 'use_for_audio': True}]
+    assert gc.get_audio_device_for_game(' game a ', mappings) == 'Game A'
+
+    # Appending to the same list and passing a new list are both picked up
+    mappings.append({'label': 'Game C', 'use_for_audio': True})
+    assert gc.get_audio_device_for_game('GAME C', mappings) == 'Game C'
+    assert gc.get_audio_device_for_game('Game C', [{'label': 'Game D'}]) is None
+
+
 def test_test_gaming_system_detects_steam(monkeypatch):
     gc = GamingController()
 
@@ -148,3 +180,18 @@ def test_test_gaming_system_no_steam(monkeypatch):
     assert res['ok'] is True
     assert res['steam_available'] is False
     assert 'Steam installation not detected' in res['issues'][0]
+
+
+def test_test_gaming_system_caches_steam_detection(monkeypatch):
+    gc = GamingController()
+    checks = []
+
+    def fake_exists(path):
+        checks.append(path)
+        return True
+
+    monkeypatch.setattr(os.path, 'exists', fake_exists)
+    assert gc.test_gaming_system()['steam_available'] is True
+    count = len(checks)
+    assert gc.test_gaming_system()['steam_available'] is True
+    assert len(checks) == count
@@ -45,6 +45,11 @@ class FakeAudio:
     def set_volume(self, percent):
         return True
 
+    debounced_result = True
+
+    def set_volume_debounced(self, percent):
+        return self.debounced_result
+
     def get_audio_snapshot(self, mappings):
         return {
             "ok": True,
@@ -152,6 +157,18 @@ def test_switch_by_id_and_key(server_app):
     assert r2.get_json()['ok'] is True
 
 
+def test_set_volume_queued_still_succeeds(monkeypatch):
+    settings = FakeSettings()
+    srv = FlaskServer(settings)
+    srv.audio_controller = FakeAudio()
+    srv.audio_controller.debounced_result = None  # coalesced into a burst
+    client = srv.app.test_client()
+
+    r = client.get('/audio/volume?token=secret&percent=30')
+    assert r.status_code == 200
+    assert r.get_json() == {'ok': True, 'queued': True, 'percent': 30}
+
+
 def test_set_volume_and_current(server_app):
     token = 'secret'
     r = server_app.get(f'/volume?token={token}&percent=50')
@@ -51,6 +51,23 @@ def test_set_audio_mappings_validation(monkeypatch, tmp_path):
     assert sum(1 for m in res if m.get('use_for_streaming')) == 1
 
 
+def test_audio_mappings_normalized_on_set_and_load(monkeypatch, tmp_path):
+    mgr = make_manager(monkeypatch, tmp_path)
+    mappings = [{'label': ' One ', 'device_id': ' dev1\n', 'use_for_streaming': True}]
+    assert mgr.set_audio_mappings(mappings, save=True) is True
+    assert mgr.get_audio_mappings()[0]['label'] == 'One'
+    assert mgr.get_audio_mappings()[0]['device_id'] == 'dev1'
+
+    # Hand-edited settings files are normalized when loaded
+    with open(mgr.settings_file, 'r', encoding='utf-8') as f:
+        data = json.load(f)
+    data['audio']['mappings'][0]['device_id'] = '  dev2  '
+    with open(mgr.settings_file, 'w', encoding='utf-8') as f:
+        json.dump(data, f)
+    reloaded = make_manager(monkeypatch, tmp_path)
+    assert reloaded.get_audio_mappings()[0]['device_id'] == 'dev2'
+
+
 def test_get_streaming_device_id(monkeypatch, tmp_path):
     mgr = make_manager(monkeypatch, tmp_path)
     mappings = [